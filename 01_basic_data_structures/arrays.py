@@ -17,6 +17,16 @@ class ArrayOperations:
         """
         self.arr.append(element)
     
+    def bulk_insert(self, elements):
+        """
+        Insert all elements from an iterable at the end of the array.
+        Prefer this over calling insert_at_end in a loop: list.extend can
+        size the list once from the iterable's length instead of growing
+        it step by step.
+        Time Complexity: O(k) where k is the number of new elements
+        """
+        self.arr.extend(elements)
+    
     def insert_at_index(self, index, element):
         """
         Insert an element at a specific index.
@@ -81,6 +91,11 @@ def main():
     arr_ops.insert_at_end(30)
     print(f"Array after insertions: {arr_ops.arr}")
     
+    # Insert many elements at once
+    print("\nBulk inserting elements...")
+    arr_ops.bulk_insert([40, 50])
+    print(f"Array after bulk insertion: {arr_ops.arr}")
+    
     # Insert at specific index
     print("\nInserting at index 1...")
     arr_ops.insert_at_index(1, 15)
@@ -17,32 +17,28 @@ class HashTable:
         self.table = [[] for _ in range(size)]  # List of lists for handling collisions
         self.count = 0  # Number of key-value pairs
     
-    def _hash_function(self, key):
-        """
-        Compute the hash value for a given key.
-        Time Complexity: O(1)
-        """
-        if isinstance(key, int):
-            return key % self.size
-        # For string keys, sum ASCII values
-        return sum(ord(c) for c in str(key)) % self.size
-    
     def insert(self, key, value):
         """
         Insert a key-value pair into the hash table.
+        Keys are hashed with the built-in hash (computed in C), and the
+        bucket index is the hash modulo the table size, computed inline.
+        Entries are stored as (hash, key, value) so the hash never has to be
+        recomputed, and the cheap hash compare runs before the key compare.
+        Keys are compared by identity first, which settles the common case
+        of the same (e.g. interned string) object without calling __eq__.
         Time Complexity: O(1) average case, O(n) worst case
         """
-        hash_value = self._hash_function(key)
-        bucket = self.table[hash_value]
+        hash_value = hash(key)
+        bucket = self.table[hash_value % self.size]
         
         # Check if key already exists
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)  # Update existing key
+        for i, (h, k, v) in enumerate(bucket):
+            if h == hash_value and (k is key or k == key):
+                bucket[i] = (hash_value, key, value)  # Update existing key
                 return
         
         # Insert new key-value pair
-        bucket.append((key, value))
+        bucket.append((hash_value, key, value))
         self.count += 1
         
         # Resize if load factor exceeds 0.7
@@ -56,11 +52,11 @@ class HashTable:
         Returns:
             The value associated with the key, or None if key not found
         """
-        hash_value = self._hash_function(key)
-        bucket = self.table[hash_value]
+        hash_value = hash(key)
+        bucket = self.table[hash_value % self.size]
         
-        for k, v in bucket:
-            if k == key:
+        for h, k, v in bucket:
+            if h == hash_value and (k is key or k == key):
                 return v
         return None
     
@@ -71,11 +67,11 @@ class HashTable:
         Returns:
             True if key was found and deleted, False otherwise
         """
-        hash_value = self._hash_function(key)
-        bucket = self.table[hash_value]
+        hash_value = hash(key)
+        bucket = self.table[hash_value % self.size]
         
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
+        for i, (h, k, v) in enumerate(bucket):
+            if h == hash_value and (k is key or k == key):
                 bucket.pop(i)
                 self.count -= 1
                 return True
@@ -84,17 +80,18 @@ class HashTable:
     def _resize(self):
         """
         Resize the hash table when load factor exceeds threshold.
+        Entries are moved using their stored hash, without rehashing keys.
         Time Complexity: O(n)
         """
         old_table = self.table
         self.size *= 2
         self.table = [[] for _ in range(self.size)]
-        self.count = 0
         
-        # Rehash all existing key-value pairs
+        table = self.table
+        size = self.size
         for bucket in old_table:
-            for key, value in bucket:
-                self.insert(key, value)
+            for entry in bucket:
+                table[entry[0] % size].append(entry)
     
     def get_size(self):
         """
@@ -119,7 +116,327 @@ class HashTable:
         print("-" * 30)
         for i, bucket in enumerate(self.table):
             if bucket:
-                print(f"Bucket {i}: {bucket}")
+                print(f"Bucket {i}: {[(k, v) for _, k, v in bucket]}")
+
+class IntHashTable(HashTable):
+    """
+    Chained hash table specialised for integer keys.
+    Uses Fibonacci (multiplicative) hashing on a power of two number of
+    buckets: the stored hash is the 64-bit product key * 0x9E3779B97F4A7C15
+    and the bucket is its top log2(size) bits, which depend on every bit of
+    the key. The bucket is computed inline in each operation, so there is
+    no modulo and no method call per lookup. The product is a function of
+    the key alone, so entries are matched on the key only.
+    """
+    def __init__(self, size=16):
+        """
+        Initialize an integer-keyed hash table.
+        Args:
+            size (int): The number of buckets, must be a power of two
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError("Size must be a power of two")
+        super().__init__(size)
+        self.shift = 65 - size.bit_length()  # Keep the top log2(size) bits
+        self.mask = size - 1
+    
+    def insert(self, key, value):
+        """
+        Insert an integer key-value pair into the hash table.
+        Time Complexity: O(1) average case, O(n) worst case
+        """
+        hash_value = (key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        bucket = self.table[hash_value >> self.shift]
+        
+        # Check if key already exists
+        for i, (h, k, v) in enumerate(bucket):
+            if k == key:
+                bucket[i] = (hash_value, key, value)  # Update existing key
+                return
+        
+        # Insert new key-value pair
+        bucket.append((hash_value, key, value))
+        self.count += 1
+        
+        # Resize if load factor exceeds 0.7
+        if self.count / self.size > 0.7:
+            self._resize()
+    
+    def get(self, key):
+        """
+        Retrieve the value associated with an integer key.
+        Time Complexity: O(1) average case, O(n) worst case
+        Returns:
+            The value associated with the key, or None if key not found
+        """
+        for h, k, v in self.table[(key * 0x9E3779B97F4A7C15 >> self.shift) & self.mask]:
+            if k == key:
+                return v
+        return None
+    
+    def delete(self, key):
+        """
+        Remove an integer key-value pair from the hash table.
+        Time Complexity: O(1) average case, O(n) worst case
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        bucket = self.table[(key * 0x9E3779B97F4A7C15 >> self.shift) & self.mask]
+        
+        for i, (h, k, v) in enumerate(bucket):
+            if k == key:
+                bucket.pop(i)
+                self.count -= 1
+                return True
+        return False
+    
+    def _resize(self):
+        """
+        Double the number of buckets, keeping one more bit of the hash.
+        Entries are moved using their stored hash, without rehashing keys.
+        Time Complexity: O(n)
+        """
+        old_table = self.table
+        self.size *= 2
+        self.shift -= 1
+        self.mask = self.size - 1
+        self.table = [[] for _ in range(self.size)]
+        
+        table = self.table
+        shift = self.shift
+        for bucket in old_table:
+            for entry in bucket:
+                table[entry[0] >> shift].append(entry)
+
+# Slot markers for the open addressing table
+_EMPTY = object()
+_TOMBSTONE = object()
+
+class OpenAddressingHashTable:
+    """
+    Hash table using open addressing with linear probing.
+    Keys and values live in two flat lists instead of a list of buckets,
+    so no per-entry tuple is allocated and a lookup scans adjacent slots.
+    """
+    def __init__(self, size=16):
+        """
+        Initialize an open addressing hash table.
+        Args:
+            size (int): Number of slots, must be a power of two
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError("Size must be a power of two")
+        self.size = size
+        self.mask = size - 1
+        self.shift = 65 - size.bit_length()  # Keep the top log2(size) bits
+        self.keys = [_EMPTY] * size
+        self.vals = [None] * size
+        self.count = 0  # Number of key-value pairs
+        self.tombstones = 0  # Number of deleted slots
+    
+    def _hash_function(self, key):
+        """
+        Compute the starting slot for a key.
+        Uses Fibonacci (multiplicative) hashing: the slot is the top
+        log2(size) bits of the 64-bit product, which depend on every bit of
+        the hash. The low bits would only depend on the hash's low bits, so
+        all multiples of the table size would start probing at slot 0.
+        Time Complexity: O(1)
+        """
+        return ((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self.shift
+    
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+        Time Complexity: O(1) average case, O(n) worst case
+        """
+        keys = self.keys
+        mask = self.mask
+        i = self._hash_function(key)
+        reusable = -1  # First tombstone seen on the probe path
+        
+        # Probe until we find the key or an empty slot
+        while keys[i] is not _EMPTY:
+            if keys[i] is _TOMBSTONE:
+                if reusable < 0:
+                    reusable = i
+            elif keys[i] is key or keys[i] == key:
+                self.vals[i] = value  # Update existing key
+                return
+            i = (i + 1) & mask
+        
+        # The key is absent, so reuse a tombstone if we passed one
+        if reusable >= 0:
+            i = reusable
+            self.tombstones -= 1
+        keys[i] = key
+        self.vals[i] = value
+        self.count += 1
+        
+        # Resize if occupied slots (including tombstones) exceed 0.7
+        if (self.count + self.tombstones) / self.size > 0.7:
+            self._resize()
+    
+    def _find(self, key):
+        """
+        Find the slot index holding key.
+        Returns:
+            The slot index, or -1 if key not found
+        """
+        keys = self.keys
+        mask = self.mask
+        i = self._hash_function(key)
+        
+        while keys[i] is not _EMPTY:
+            if keys[i] is key or keys[i] == key:
+                return i
+            i = (i + 1) & mask
+        return -1
+    
+    def get(self, key):
+        """
+        Retrieve the value associated with a key.
+        Time Complexity: O(1) average case, O(n) worst case
+        Returns:
+            The value associated with the key, or None if key not found
+        """
+        i = self._find(key)
+        if i < 0:
+            return None
+        return self.vals[i]
+    
+    def delete(self, key):
+        """
+        Remove a key-value pair from the hash table.
+        The slot is marked with a tombstone so later probe chains stay intact.
+        Time Complexity: O(1) average case, O(n) worst case
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        i = self._find(key)
+        if i < 0:
+            return False
+        self.keys[i] = _TOMBSTONE
+        self.vals[i] = None
+        self.count -= 1
+        self.tombstones += 1
+        return True
+    
+    def _resize(self):
+        """
+        Rebuild the table, dropping all tombstones.
+        The number of slots is doubled only if live entries fill more than
+        half of them; otherwise the table was mostly tombstones and keeps
+        its size.
+        Time Complexity: O(n)
+        """
+        old_keys = self.keys
+        old_vals = self.vals
+        if self.count * 2 > self.size:
+            self.size *= 2
+        self.mask = self.size - 1
+        self.shift = 65 - self.size.bit_length()
+        self.keys = [_EMPTY] * self.size
+        self.vals = [None] * self.size
+        self.tombstones = 0
+        
+        keys = self.keys
+        vals = self.vals
+        mask = self.mask
+        for key, value in zip(old_keys, old_vals):
+            if key is _EMPTY or key is _TOMBSTONE:
+                continue
+            i = self._hash_function(key)
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i] = key
+            vals[i] = value
+    
+    def get_size(self):
+        """
+        Get the number of key-value pairs in the hash table.
+        Time Complexity: O(1)
+        """
+        return self.count
+    
+    def is_empty(self):
+        """
+        Check if the hash table is empty.
+        Time Complexity: O(1)
+        """
+        return self.count == 0
+    
+    def display(self):
+        """
+        Display the contents of the hash table.
+        Time Complexity: O(n)
+        """
+        print("\nHash Table Contents:")
+        print("-" * 30)
+        for i, key in enumerate(self.keys):
+            if key is not _EMPTY and key is not _TOMBSTONE:
+                print(f"Slot {i}: ({key!r}, {self.vals[i]!r})")
+
+class DictHashTable:
+    """
+    Hash table with the same interface, backed by Python's built-in dict.
+    dict is itself an open addressing hash table written in C, so this is
+    the variant to use when speed matters more than seeing the mechanics.
+    """
+    def __init__(self):
+        """
+        Initialize an empty hash table.
+        """
+        self._d = {}
+    
+    def insert(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+        Time Complexity: O(1) average case
+        """
+        self._d[key] = value
+    
+    def get(self, key):
+        """
+        Retrieve the value associated with a key.
+        Time Complexity: O(1) average case
+        Returns:
+            The value associated with the key, or None if key not found
+        """
+        return self._d.get(key)
+    
+    def delete(self, key):
+        """
+        Remove a key-value pair from the hash table.
+        Time Complexity: O(1) average case
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        return self._d.pop(key, _EMPTY) is not _EMPTY
+    
+    def get_size(self):
+        """
+        Get the number of key-value pairs in the hash table.
+        Time Complexity: O(1)
+        """
+        return len(self._d)
+    
+    def is_empty(self):
+        """
+        Check if the hash table is empty.
+        Time Complexity: O(1)
+        """
+        return not self._d
+    
+    def display(self):
+        """
+        Display the contents of the hash table.
+        Time Complexity: O(n)
+        """
+        print("\nHash Table Contents:")
+        print("-" * 30)
+        for key, value in self._d.items():
+            print(f"{key!r}: {value!r}")
 
 def main():
     # Create a new hash table
@@ -159,6 +476,36 @@ def main():
     
     # Check if empty
     print(f"Is hash table empty? {ht.is_empty()}")
+    
+    # Integer-keyed variant
+    print("\nInteger Hash Table Demo:")
+    print("-" * 30)
+    iht = IntHashTable()
+    for i in range(0, 100, 10):
+        iht.insert(i, str(i))
+    print(f"Value for key 40: {iht.get(40)}")
+    print(f"Number of key-value pairs: {iht.get_size()} (buckets: {iht.size})")
+    
+    # Open addressing variant
+    print("\nOpen Addressing Hash Table Demo:")
+    print("-" * 30)
+    oa = OpenAddressingHashTable()
+    for i in range(20):
+        oa.insert(i, i * i)
+    oa.delete(5)
+    print(f"Value for key 7: {oa.get(7)}")
+    print(f"Value for deleted key 5: {oa.get(5)}")
+    print(f"Number of key-value pairs: {oa.get_size()} (slots: {oa.size})")
+    
+    # Built-in dict backend
+    print("\nDict Hash Table Demo:")
+    print("-" * 30)
+    dht = DictHashTable()
+    dht.insert("name", "John")
+    dht.insert("age", 25)
+    dht.delete("age")
+    dht.display()
+    print(f"Number of key-value pairs: {dht.get_size()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
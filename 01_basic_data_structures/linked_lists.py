@@ -8,6 +8,8 @@ Each node contains:
 - next: Reference to the next node
 """
 
+from array import array
+
 class Node:
     def __init__(self, data):
         """
@@ -133,6 +135,179 @@ class LinkedList:
             current = current.next
         print("None")
 
+class ArrayLinkedList:
+    """
+    Singly linked list stored as parallel arrays (structure of arrays).
+    Node i holds data[i] and the index of its successor in next[i], with -1
+    marking the end of the list. Unused slots are chained into a free list,
+    so deleted nodes are recycled instead of reallocated.
+    """
+    def __init__(self, capacity=8):
+        """
+        Initialize an empty linked list with room for capacity nodes.
+        """
+        self.data = [None] * capacity
+        self.next = array('i', range(1, capacity + 1))
+        if capacity:
+            self.next[-1] = -1
+        self.free = 0 if capacity else -1  # Head of the free list
+        self.head = -1
+        self.tail = -1  # Index of the last node, so appends need no walk
+        self.size = 0
+    
+    def _grow(self):
+        """
+        Add free slots using the same over-allocation curve as CPython lists.
+        Time Complexity: O(n)
+        """
+        old_capacity = len(self.data)
+        new_capacity = old_capacity + (old_capacity >> 3) + 6
+        self.data.extend([None] * (new_capacity - old_capacity))
+        self.next.extend(range(old_capacity + 1, new_capacity + 1))
+        self.next[-1] = self.free
+        self.free = old_capacity
+    
+    def _allocate(self, data):
+        """
+        Take a slot from the free list and store data in it.
+        Returns the index of the new node.
+        """
+        if self.free == -1:
+            self._grow()
+        i = self.free
+        self.free = self.next[i]
+        self.data[i] = data
+        self.next[i] = -1
+        self.size += 1
+        return i
+    
+    def _release(self, i):
+        """
+        Return the slot at index i to the free list.
+        """
+        self.data[i] = None
+        self.next[i] = self.free
+        self.free = i
+        self.size -= 1
+    
+    def is_empty(self):
+        """
+        Check if the linked list is empty.
+        Time Complexity: O(1)
+        """
+        return self.head == -1
+    
+    def insert_at_beginning(self, data):
+        """
+        Insert a new node at the beginning of the list.
+        Time Complexity: O(1) amortized
+        """
+        i = self._allocate(data)
+        self.next[i] = self.head
+        self.head = i
+        if self.tail == -1:
+            self.tail = i
+    
+    def insert_at_end(self, data):
+        """
+        Insert a new node at the end of the list.
+        Time Complexity: O(1) amortized
+        """
+        i = self._allocate(data)
+        
+        if self.head == -1:
+            self.head = i
+        else:
+            self.next[self.tail] = i
+        self.tail = i
+    
+    def insert_after(self, prev_index, data):
+        """
+        Insert a new node after the node at a given index.
+        Time Complexity: O(1) amortized
+        """
+        if prev_index < 0:
+            print("Previous node cannot be None")
+            return
+        
+        i = self._allocate(data)
+        self.next[i] = self.next[prev_index]
+        self.next[prev_index] = i
+        if prev_index == self.tail:
+            self.tail = i
+    
+    def delete_node(self, key):
+        """
+        Delete the first occurrence of a node with given key.
+        Time Complexity: O(n)
+        """
+        if self.is_empty():
+            print("List is empty")
+            return
+        
+        data = self.data
+        nxt = self.next
+        
+        # If head node holds the key
+        if data[self.head] == key:
+            removed = self.head
+            self.head = nxt[removed]
+            if self.head == -1:
+                self.tail = -1
+            self._release(removed)
+            return
+        
+        # Search for the key
+        current = self.head
+        while nxt[current] != -1:
+            following = nxt[current]
+            if data[following] == key:
+                nxt[current] = nxt[following]
+                if following == self.tail:
+                    self.tail = current
+                self._release(following)
+                return
+            current = following
+        
+        print(f"Key {key} not found in the list")
+    
+    def search(self, key):
+        """
+        Search for a key in the linked list.
+        Time Complexity: O(n)
+        Returns the index of the node if found, -1 otherwise
+        """
+        data = self.data
+        nxt = self.next
+        current = self.head
+        while current != -1:
+            if data[current] == key:
+                return current
+            current = nxt[current]
+        return -1
+    
+    def get_size(self):
+        """
+        Get the size of the linked list.
+        Time Complexity: O(1)
+        """
+        return self.size
+    
+    def display(self):
+        """
+        Display the linked list.
+        Time Complexity: O(n)
+        """
+        if self.is_empty():
+            print("List is empty")
+            return
+        
+        current = self.head
+        while current != -1:
+            print(self.data[current], end=" -> ")
+            current = self.next[current]
+        print("None")
+
 def main():
     # Create a new linked list
     ll = LinkedList()
@@ -179,6 +354,22 @@ def main():
     
     # Get size
     print(f"\nSize of the list: {ll.get_size()}")
+    
+    # Array-backed linked list
+    print("\nArray Linked List Operations Demo:")
+    print("-" * 30)
+    arr_list = ArrayLinkedList()
+    arr_list.insert_at_beginning(10)
+    arr_list.insert_at_beginning(20)
+    arr_list.insert_at_end(30)
+    arr_list.insert_at_end(40)
+    index = arr_list.search(30)
+    if index != -1:
+        arr_list.insert_after(index, 35)
+    arr_list.delete_node(20)
+    print("List after insertions and deleting 20:")
+    arr_list.display()
+    print(f"Size of the list: {arr_list.get_size()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
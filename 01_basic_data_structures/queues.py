@@ -11,6 +11,7 @@ Common operations:
 - size: Get the number of elements in the queue
 """
 
+from array import array
 from collections import deque
 
 class Queue:
@@ -34,9 +35,10 @@ class Queue:
         Time Complexity: O(1)
         Raises IndexError if queue is empty
         """
-        if not self.is_empty():
+        try:
             return self.items.popleft()
-        raise IndexError("Queue is empty")
+        except IndexError:
+            raise IndexError("Queue is empty") from None
     
     def front(self):
         """
@@ -44,9 +46,10 @@ class Queue:
         Time Complexity: O(1)
         Raises IndexError if queue is empty
         """
-        if not self.is_empty():
+        try:
             return self.items[0]
-        raise IndexError("Queue is empty")
+        except IndexError:
+            raise IndexError("Queue is empty") from None
     
     def rear(self):
         """
@@ -54,9 +57,10 @@ class Queue:
         Time Complexity: O(1)
         Raises IndexError if queue is empty
         """
-        if not self.is_empty():
+        try:
             return self.items[-1]
-        raise IndexError("Queue is empty")
+        except IndexError:
+            raise IndexError("Queue is empty") from None
     
     def is_empty(self):
         """
@@ -78,6 +82,129 @@ class Queue:
         Time Complexity: O(1)
         """
         self.items.clear()
+    
+    def __iter__(self):
+        """
+        Iterate over the elements from front to rear without copying them.
+        """
+        return iter(self.items)
+    
+    def __len__(self):
+        """
+        Return the number of elements in the queue.
+        """
+        return len(self.items)
+
+class IntQueue(Queue):
+    """
+    Queue specialised for 64-bit integers.
+    Items are stored unboxed in a ring buffer backed by array.array('q');
+    dequeue only advances the head index.
+    """
+    def __init__(self, capacity=8):
+        """
+        Initialize an empty queue with room for capacity elements.
+        Args:
+            capacity (int): Initial buffer size, rounded up to a power of two
+        """
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.items = array('q', bytes(8 * size))
+        self.mask = size - 1
+        self.head = 0
+        self.count = 0
+    
+    def _grow(self):
+        """
+        Double the buffer, moving the elements to the start of the new one.
+        Time Complexity: O(n)
+        """
+        items = array('q', self)
+        items.frombytes(bytes(8 * len(self.items)))
+        self.items = items
+        self.mask = len(items) - 1
+        self.head = 0
+    
+    def enqueue(self, item):
+        """
+        Add an element to the rear of the queue.
+        Time Complexity: O(1) amortized
+        """
+        if self.count == len(self.items):
+            self._grow()
+        self.items[(self.head + self.count) & self.mask] = item
+        self.count += 1
+    
+    def dequeue(self):
+        """
+        Remove and return the front element from the queue.
+        Time Complexity: O(1)
+        Raises IndexError if queue is empty
+        """
+        if self.count == 0:
+            raise IndexError("Queue is empty")
+        item = self.items[self.head]
+        self.head = (self.head + 1) & self.mask
+        self.count -= 1
+        return item
+    
+    def front(self):
+        """
+        Return the front element without removing it.
+        Time Complexity: O(1)
+        Raises IndexError if queue is empty
+        """
+        if self.count == 0:
+            raise IndexError("Queue is empty")
+        return self.items[self.head]
+    
+    def rear(self):
+        """
+        Return the rear element without removing it.
+        Time Complexity: O(1)
+        Raises IndexError if queue is empty
+        """
+        if self.count == 0:
+            raise IndexError("Queue is empty")
+        return self.items[(self.head + self.count - 1) & self.mask]
+    
+    def is_empty(self):
+        """
+        Check if the queue is empty.
+        Time Complexity: O(1)
+        """
+        return self.count == 0
+    
+    def size(self):
+        """
+        Return the number of elements in the queue.
+        Time Complexity: O(1)
+        """
+        return self.count
+    
+    def clear(self):
+        """
+        Remove all elements from the queue.
+        Time Complexity: O(1)
+        """
+        self.head = 0
+        self.count = 0
+    
+    def __iter__(self):
+        """
+        Iterate over the elements from front to rear without copying them.
+        """
+        items = self.items
+        mask = self.mask
+        for i in range(self.head, self.head + self.count):
+            yield items[i & mask]
+    
+    def __len__(self):
+        """
+        Return the number of elements in the queue.
+        """
+        return self.count
 
 def main():
     # Create a new queue
@@ -92,7 +219,7 @@ def main():
     queue.enqueue("First")
     queue.enqueue("Second")
     queue.enqueue("Third")
-    print(f"Queue after enqueueing: {list(queue.items)}")
+    print(f"Queue after enqueueing: {', '.join(map(str, queue))}")
     
     # View front and rear
     print(f"\nFront element: {queue.front()}")
@@ -115,13 +242,22 @@ def main():
     queue.enqueue(1)
     queue.enqueue(2)
     queue.enqueue(3)
-    print(f"Queue: {list(queue.items)}")
+    print(f"Queue: {', '.join(map(str, queue))}")
     print(f"Queue size: {queue.size()}")
     
     # Clear the queue
     print("\nClearing the queue...")
     queue.clear()
     print(f"Queue is empty: {queue.is_empty()}")
+    
+    # Integer-only queue
+    print("\nInteger queue backed by a ring buffer...")
+    int_queue = IntQueue()
+    for value in range(10):
+        int_queue.enqueue(value)
+    print(f"Dequeued: {int_queue.dequeue()}")
+    print(f"Queue: {', '.join(map(str, int_queue))}")
+    print(f"Queue size: {len(int_queue)}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -10,6 +10,8 @@ Common operations:
 - size: Get the number of elements in the stack
 """
 
+from array import array
+
 class Stack:
     def __init__(self):
         """Initialize an empty stack using a list."""
@@ -28,9 +30,10 @@ class Stack:
         Time Complexity: O(1)
         Raises IndexError if stack is empty
         """
-        if not self.is_empty():
+        try:
             return self.items.pop()
-        raise IndexError("Stack is empty")
+        except IndexError:
+            raise IndexError("Stack is empty") from None
     
     def peek(self):
         """
@@ -38,9 +41,10 @@ class Stack:
         Time Complexity: O(1)
         Raises IndexError if stack is empty
         """
-        if not self.is_empty():
+        try:
             return self.items[-1]
-        raise IndexError("Stack is empty")
+        except IndexError:
+            raise IndexError("Stack is empty") from None
     
     def is_empty(self):
         """
@@ -63,6 +67,23 @@ class Stack:
         """
         self.items.clear()
 
+class IntStack(Stack):
+    """
+    Stack specialised for 64-bit integers.
+    Items are stored unboxed in an array.array('q') instead of a list of
+    int objects, which uses several times less memory per element.
+    """
+    def __init__(self):
+        """Initialize an empty stack using a typed integer array."""
+        self.items = array('q')
+    
+    def clear(self):
+        """
+        Remove all elements from the stack.
+        Time Complexity: O(1)
+        """
+        del self.items[:]
+
 def main():
     # Create a new stack
     stack = Stack()
@@ -105,6 +126,14 @@ def main():
     print("\nClearing the stack...")
     stack.clear()
     print(f"Stack is empty: {stack.is_empty()}")
+    
+    # Integer-only stack
+    print("\nInteger stack backed by a typed array...")
+    int_stack = IntStack()
+    for value in (1, 2, 3):
+        int_stack.push(value)
+    print(f"Popped: {int_stack.pop()}")
+    print(f"Stack size: {int_stack.size()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
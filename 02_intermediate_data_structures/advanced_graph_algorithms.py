@@ -7,7 +7,7 @@ This implementation includes:
 These algorithms are fundamental for analyzing directed graphs and their properties.
 """
 
-from collections import defaultdict, deque
+from array import array
 
 class AdvancedGraphAlgorithms:
     def __init__(self, graph):
@@ -17,42 +17,122 @@ class AdvancedGraphAlgorithms:
             graph: Graph object with vertices and edges
         """
         self.graph = graph
-        self.vertices = graph.get_vertices()
-        self.adj_list = graph.adj_list
+        self._version = None
+        self._refresh()
+    
+    def _refresh(self):
+        """
+        Take the graph's compressed sparse row (CSR) adjacency, unless the
+        graph has not changed since the last call. Vertices are numbered
+        0..V-1 and the neighbors of vertex i are
+        indices[indptr[i]:indptr[i + 1]], stored in two flat integer arrays.
+        Time Complexity: O(1) if unchanged, O(V log V + E) otherwise
+        """
+        graph = self.graph
+        if self._version == graph.version:
+            return
+        if graph.indptr is None:
+            graph.finalize()
+        self._version = graph.version
+        self.vertices = graph.label_of
+        self.indptr = graph.indptr
+        self.indices = graph.indices
+        self._reversed_csr = None  # Built on first use by find_scc
     
     def _reverse_graph(self):
         """
-        Create a reversed version of the graph.
+        Create a reversed version of the graph in CSR form.
+        Uses a counting sort over the edges: one pass counts the in-degree
+        of every vertex, a prefix sum turns the counts into row offsets and
+        a second pass drops each source into its slot.
+        Time Complexity: O(V + E)
         Returns:
-            Dictionary representing the reversed adjacency list
+            Tuple of (rev_indptr, rev_indices) for the reversed graph
         """
-        reversed_adj = defaultdict(list)
-        for vertex in self.vertices:
-            for neighbor, weight in self.adj_list[vertex]:
-                reversed_adj[neighbor].append((vertex, weight))
-        return reversed_adj
+        n = len(self.vertices)
+        indptr = self.indptr
+        indices = self.indices
+        
+        # Count in-degrees
+        rev_indptr = array('i', bytes(4 * (n + 1)))
+        for target in indices:
+            rev_indptr[target + 1] += 1
+        for i in range(n):
+            rev_indptr[i + 1] += rev_indptr[i]
+        
+        # Place each source at the next free position of its target's row
+        rev_indices = array('i', bytes(4 * len(indices)))
+        position = array('i', rev_indptr)
+        for vertex in range(n):
+            for k in range(indptr[vertex], indptr[vertex + 1]):
+                target = indices[k]
+                rev_indices[position[target]] = vertex
+                position[target] += 1
+        
+        return rev_indptr, rev_indices
     
-    def _dfs_first_pass(self, vertex, visited, order):
+    def _dfs_first_pass(self, vertex, visited, order, next_edge):
         """
         First DFS pass for Kosaraju's algorithm.
         Fills the order stack with vertices in order of finishing times.
+        Uses an explicit stack instead of recursion; next_edge[u] is the
+        position of the next unexplored edge of u in the CSR arrays.
         """
-        visited.add(vertex)
-        for neighbor, _ in self.adj_list[vertex]:
-            if neighbor not in visited:
-                self._dfs_first_pass(neighbor, visited, order)
-        order.append(vertex)
+        # Bind attributes and methods to locals for the inner loop
+        indptr = self.indptr
+        indices = self.indices
+        finish = order.append
+        visited[vertex] = 1
+        stack = [vertex]
+        push = stack.append
+        pop = stack.pop
+        
+        while stack:
+            current = stack[-1]
+            k = next_edge[current]
+            end = indptr[current + 1]
+            while k < end and visited[indices[k]]:
+                k += 1
+            
+            if k < end:
+                neighbor = indices[k]
+                next_edge[current] = k + 1
+                visited[neighbor] = 1
+                push(neighbor)
+            else:
+                # All neighbors explored, vertex is finished
+                next_edge[current] = end
+                finish(current)
+                pop()
     
-    def _dfs_second_pass(self, vertex, visited, component, reversed_adj):
+    def _dfs_second_pass(self, vertex, visited, component, rev_indptr, rev_indices, next_edge):
         """
         Second DFS pass for Kosaraju's algorithm.
         Finds all vertices in the current strongly connected component.
         """
-        visited.add(vertex)
-        component.append(vertex)
-        for neighbor, _ in reversed_adj[vertex]:
-            if neighbor not in visited:
-                self._dfs_second_pass(neighbor, visited, component, reversed_adj)
+        add_to_component = component.append
+        visited[vertex] = 1
+        add_to_component(vertex)
+        stack = [vertex]
+        push = stack.append
+        pop = stack.pop
+        
+        while stack:
+            current = stack[-1]
+            k = next_edge[current]
+            end = rev_indptr[current + 1]
+            while k < end and visited[rev_indices[k]]:
+                k += 1
+            
+            if k < end:
+                neighbor = rev_indices[k]
+                next_edge[current] = k + 1
+                visited[neighbor] = 1
+                add_to_component(neighbor)
+                push(neighbor)
+            else:
+                next_edge[current] = end
+                pop()
     
     def find_scc(self):
         """
@@ -61,44 +141,74 @@ class AdvancedGraphAlgorithms:
         Returns:
             List of lists, where each inner list represents a strongly connected component
         """
-        # First DFS pass to get the order
-        visited = set()
+        self._refresh()
+        vertices = self.vertices
+        n = len(vertices)
+        
+        # First DFS pass to get the order; visited is indexed by vertex id
+        visited = bytearray(n)
         order = []
-        for vertex in self.vertices:
-            if vertex not in visited:
-                self._dfs_first_pass(vertex, visited, order)
+        next_edge = array('i', self.indptr)
+        first_pass = self._dfs_first_pass
+        for vertex in range(n):
+            if not visited[vertex]:
+                first_pass(vertex, visited, order, next_edge)
         
-        # Second DFS pass on reversed graph
-        reversed_adj = self._reverse_graph()
-        visited = set()
+        # Second DFS pass on reversed graph, reusing it across calls
+        if self._reversed_csr is None:
+            self._reversed_csr = self._reverse_graph()
+        rev_indptr, rev_indices = self._reversed_csr
+        visited = bytearray(n)
         scc_list = []
+        next_edge = array('i', rev_indptr)
         
-        # Process vertices in reverse order of finishing times
+        second_pass = self._dfs_second_pass
+        
+        # Process vertices in reverse order of finishing times.
+        # reversed() walks the list backwards in C without copying it, which
+        # is faster in CPython than an explicit index loop.
         for vertex in reversed(order):
-            if vertex not in visited:
+            if not visited[vertex]:
                 component = []
-                self._dfs_second_pass(vertex, visited, component, reversed_adj)
-                scc_list.append(component)
+                second_pass(vertex, visited, component,
+                            rev_indptr, rev_indices, next_edge)
+                scc_list.append([vertices[i] for i in component])
         
         return scc_list
     
-    def _dfs_topological(self, vertex, visited, temp_visited, order):
+    def _dfs_topological(self, vertex, visited, temp_visited, order, next_edge):
         """
         Helper function for topological sort using DFS.
+        Vertices stay in temp_visited while they are on the explicit stack.
         Returns True if a cycle is detected.
         """
-        visited.add(vertex)
-        temp_visited.add(vertex)
+        indptr = self.indptr
+        indices = self.indices
+        visited[vertex] = 1
+        temp_visited[vertex] = 1
+        stack = [vertex]
         
-        for neighbor, _ in self.adj_list[vertex]:
-            if neighbor not in visited:
-                if self._dfs_topological(neighbor, visited, temp_visited, order):
+        while stack:
+            current = stack[-1]
+            k = next_edge[current]
+            end = indptr[current + 1]
+            while k < end and visited[indices[k]]:
+                if temp_visited[indices[k]]:
                     return True
-            elif neighbor in temp_visited:
-                return True
+                k += 1
+            
+            if k < end:
+                neighbor = indices[k]
+                next_edge[current] = k + 1
+                visited[neighbor] = 1
+                temp_visited[neighbor] = 1
+                stack.append(neighbor)
+            else:
+                next_edge[current] = end
+                temp_visited[current] = 0
+                order.append(current)
+                stack.pop()
         
-        temp_visited.remove(vertex)
-        order.appendleft(vertex)
         return False
     
     def topological_sort(self):
@@ -108,16 +218,20 @@ class AdvancedGraphAlgorithms:
         Returns:
             List of vertices in topological order, or None if graph has cycles
         """
-        visited = set()
-        temp_visited = set()
-        order = deque()
+        self._refresh()
+        n = len(self.vertices)
+        visited = bytearray(n)
+        temp_visited = bytearray(n)  # Vertices on the current DFS path
+        order = []
+        next_edge = array('i', self.indptr)
         
-        for vertex in self.vertices:
-            if vertex not in visited:
-                if self._dfs_topological(vertex, visited, temp_visited, order):
+        for vertex in range(n):
+            if not visited[vertex]:
+                if self._dfs_topological(vertex, visited, temp_visited, order, next_edge):
                     return None  # Graph has cycles
         
-        return list(order)
+        # Vertices were appended as they finished, so reverse the list
+        return [self.vertices[i] for i in reversed(order)]
 
 def main():
     # Create a directed graph
@@ -5,9 +5,15 @@ A binary search tree is a binary tree where for each node:
 - All nodes in the left subtree have values less than the node's value
 - All nodes in the right subtree have values greater than the node's value
 This property enables efficient searching, insertion, and deletion operations.
+A red-black tree variant keeps the tree balanced so these stay O(log n).
 """
 
+from array import array
+from collections import deque
+
 class BSTNode:
+    __slots__ = ('value', 'left', 'right')
+    
     def __init__(self, value):
         """
         Initialize a BST node with a value.
@@ -23,6 +29,37 @@ class BinarySearchTree:
         """
         self.root = None
     
+    @classmethod
+    def from_sorted(cls, values):
+        """
+        Build a balanced BST from a sequence of values.
+        The middle value becomes the root and each half is built the same
+        way, using an explicit stack of (parent, side, lo, hi) ranges.
+        Time Complexity: O(n) if values are already sorted, O(n log n) otherwise
+        """
+        values = list(values)
+        if any(a > b for a, b in zip(values, values[1:])):
+            values.sort()
+        
+        tree = cls()
+        stack = [(None, None, 0, len(values) - 1)]
+        while stack:
+            parent, side, lo, hi = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = BSTNode(values[mid])
+            if parent is None:
+                tree.root = node
+            elif side == "left":
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((node, "right", mid + 1, hi))
+            stack.append((node, "left", lo, mid - 1))
+        
+        return tree
+    
     def insert(self, value):
         """
         Insert a value into the BST.
@@ -32,22 +69,19 @@ class BinarySearchTree:
             self.root = BSTNode(value)
             return
         
-        self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node, value):
-        """
-        Helper method for recursive insertion.
-        """
-        if value < node.value:
-            if node.left is None:
-                node.left = BSTNode(value)
-            else:
-                self._insert_recursive(node.left, value)
-        else:
-            if node.right is None:
-                node.right = BSTNode(value)
+        # Walk down to the empty child slot where the value belongs
+        node = self.root
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    node.left = BSTNode(value)
+                    return
+                node = node.left
             else:
-                self._insert_recursive(node.right, value)
+                if node.right is None:
+                    node.right = BSTNode(value)
+                    return
+                node = node.right
     
     def search(self, value):
         """
@@ -56,92 +90,97 @@ class BinarySearchTree:
         Returns:
             The node if found, None otherwise
         """
-        return self._search_recursive(self.root, value)
-    
-    def _search_recursive(self, node, value):
-        """
-        Helper method for recursive search.
-        """
-        if node is None or node.value == value:
-            return node
-        
-        if value < node.value:
-            return self._search_recursive(node.left, value)
-        return self._search_recursive(node.right, value)
+        node = self.root
+        while node is not None and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
     
     def delete(self, value):
         """
         Delete a value from the BST.
         Time Complexity: O(h) where h is the height of the tree
         """
-        self.root = self._delete_recursive(self.root, value)
-    
-    def _delete_recursive(self, node, value):
-        """
-        Helper method for recursive deletion.
-        """
+        # Find the node and its parent
+        parent = None
+        node = self.root
+        while node is not None and node.value != value:
+            parent = node
+            node = node.left if value < node.value else node.right
+        
         if node is None:
-            return node
+            return
         
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            # Node with only one child or no child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # Node with two children: Get the inorder successor (smallest in right subtree)
-            node.value = self._min_value(node.right)
-            node.right = self._delete_recursive(node.right, node.value)
+        # Node with two children: copy the inorder successor (smallest in
+        # right subtree) into it, then remove the successor instead
+        if node.left is not None and node.right is not None:
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+            node.value = successor.value
+            node = successor
         
-        return node
-    
-    def _min_value(self, node):
-        """
-        Find the minimum value in a subtree.
-        """
-        current = node
-        while current.left:
-            current = current.left
-        return current.value
+        # Node now has at most one child, so splice it out. The detached
+        # node is not pooled for reuse: search() hands out nodes, and a
+        # recycled one would change value under a caller still holding it.
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
     
     def inorder_traversal(self, node=None):
         """
         Perform inorder traversal (Left -> Root -> Right).
-        Time Complexity: O(n)
+        Walks the tree with an explicit stack of the current path instead
+        of recursing, and never modifies the tree.
+        Time Complexity: O(n), O(h) extra space where h is the height of the tree
         """
         if node is None:
             node = self.root
         
-        if node:
-            self.inorder_traversal(node.left)
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        while stack or node:
+            while node:
+                push(node)
+                node = node.left
+            node = pop()
             print(node.value, end=" ")
-            self.inorder_traversal(node.right)
+            node = node.right
     
-    def is_valid_bst(self, node=None, min_val=float('-inf'), max_val=float('inf')):
+    def is_valid_bst(self, node=None):
         """
         Check if the tree is a valid BST.
+        Walks the tree inorder with an explicit stack and stops at the
+        first value that is not greater than the one before it.
         Time Complexity: O(n)
         """
         if node is None:
             node = self.root
         
-        if node is None:
-            return True
-        
-        if not (min_val < node.value < max_val):
-            return False
+        stack = []
+        prev = None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if prev is not None and node.value <= prev:
+                return False
+            prev = node.value
+            node = node.right
         
-        return (self.is_valid_bst(node.left, min_val, node.value) and
-                self.is_valid_bst(node.right, node.value, max_val))
+        return True
     
     def get_height(self, node=None):
         """
         Calculate the height of the BST.
+        Counts levels with a level-order traversal instead of recursing.
         Time Complexity: O(n)
         """
         if node is None:
@@ -150,10 +189,433 @@ class BinarySearchTree:
         if not node:
             return -1
         
-        left_height = self.get_height(node.left)
-        right_height = self.get_height(node.right)
+        height = -1
+        queue = deque([node])
+        while queue:
+            height += 1
+            for _ in range(len(queue)):
+                current = queue.popleft()
+                if current.left:
+                    queue.append(current.left)
+                if current.right:
+                    queue.append(current.right)
         
-        return max(left_height, right_height) + 1
+        return height
+
+class ArrayBinarySearchTree:
+    """
+    Binary search tree stored as parallel arrays (structure of arrays).
+    Node i holds value[i] and the indices of its children in left[i] and
+    right[i], with -1 for a missing child. There is no Python object per
+    node, and deleted slots are chained into a free list through left[]
+    for reuse.
+    """
+    _blank = None  # Placeholder stored in unused value slots
+    
+    def __init__(self, capacity=16):
+        """
+        Initialize an empty tree with room for capacity nodes.
+        """
+        self.value = [self._blank] * capacity
+        self.left = array('i', range(1, capacity + 1))
+        if capacity:
+            self.left[-1] = -1
+        self.right = array('i', [-1]) * capacity
+        self.free = 0 if capacity else -1  # Head of the free list
+        self.root = -1
+        self.size = 0
+    
+    def _allocate(self, value):
+        """
+        Take a slot from the free list, doubling the arrays if it is empty.
+        Returns the index of the new node.
+        """
+        if self.free == -1:
+            old_capacity = len(self.value)
+            new_capacity = max(2 * old_capacity, 1)
+            self.value.extend([self._blank] * (new_capacity - old_capacity))
+            self.left.extend(range(old_capacity + 1, new_capacity + 1))
+            self.left[-1] = -1
+            self.right.extend([-1] * (new_capacity - old_capacity))
+            self.free = old_capacity
+        
+        i = self.free
+        # Store the value before unlinking the slot: a typed value array
+        # rejects values it cannot hold, and the slot must stay free then
+        self.value[i] = value
+        self.free = self.left[i]
+        self.left[i] = -1
+        self.right[i] = -1
+        self.size += 1
+        return i
+    
+    def _release(self, i):
+        """
+        Return the slot at index i to the free list.
+        """
+        self.value[i] = self._blank
+        self.left[i] = self.free
+        self.right[i] = -1
+        self.free = i
+        self.size -= 1
+    
+    def insert(self, value):
+        """
+        Insert a value into the BST.
+        Time Complexity: O(h) where h is the height of the tree
+        """
+        new = self._allocate(value)
+        if self.root == -1:
+            self.root = new
+            return
+        
+        values = self.value
+        left = self.left
+        right = self.right
+        i = self.root
+        while True:
+            if value < values[i]:
+                if left[i] == -1:
+                    left[i] = new
+                    return
+                i = left[i]
+            else:
+                if right[i] == -1:
+                    right[i] = new
+                    return
+                i = right[i]
+    
+    def search(self, value):
+        """
+        Search for a value in the BST.
+        Time Complexity: O(h) where h is the height of the tree
+        Returns:
+            The index of the node if found, -1 otherwise
+        """
+        values = self.value
+        left = self.left
+        right = self.right
+        i = self.root
+        while i != -1 and values[i] != value:
+            i = left[i] if value < values[i] else right[i]
+        return i
+    
+    def delete(self, value):
+        """
+        Delete a value from the BST.
+        Time Complexity: O(h) where h is the height of the tree
+        """
+        values = self.value
+        left = self.left
+        right = self.right
+        
+        # Find the node and its parent
+        parent = -1
+        i = self.root
+        while i != -1 and values[i] != value:
+            parent = i
+            i = left[i] if value < values[i] else right[i]
+        
+        if i == -1:
+            return
+        
+        # Two children: copy the inorder successor in and remove it instead
+        if left[i] != -1 and right[i] != -1:
+            parent = i
+            successor = right[i]
+            while left[successor] != -1:
+                parent = successor
+                successor = left[successor]
+            values[i] = values[successor]
+            i = successor
+        
+        # Node now has at most one child, so splice it out
+        child = left[i] if left[i] != -1 else right[i]
+        if parent == -1:
+            self.root = child
+        elif left[parent] == i:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(i)
+    
+    def inorder_traversal(self):
+        """
+        Perform inorder traversal (Left -> Root -> Right).
+        Time Complexity: O(n)
+        """
+        left = self.left
+        right = self.right
+        stack = []
+        i = self.root
+        while stack or i != -1:
+            while i != -1:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            print(self.value[i], end=" ")
+            i = right[i]
+    
+    def get_size(self):
+        """
+        Get the number of values in the tree.
+        Time Complexity: O(1)
+        """
+        return self.size
+
+class IntArrayBinarySearchTree(ArrayBinarySearchTree):
+    """
+    Array-backed binary search tree specialised for 64-bit integers.
+    Values are stored unboxed in an array.array('q') alongside the child
+    index arrays, so a node costs 16 bytes with no Python objects at all.
+    """
+    _blank = 0
+    
+    def __init__(self, capacity=16):
+        """
+        Initialize an empty tree with room for capacity nodes.
+        """
+        super().__init__(capacity)
+        self.value = array('q', self.value)
+
+# Node colors for the red-black tree
+RED = True
+BLACK = False
+
+class RBNode(BSTNode):
+    __slots__ = ('parent', 'color')
+    
+    def __init__(self, value):
+        """
+        Initialize a red-black tree node. New nodes are always red.
+        """
+        super().__init__(value)
+        self.parent = None
+        self.color = RED
+
+def _is_black(node):
+    """
+    Missing (None) children count as black leaves.
+    """
+    return node is None or node.color == BLACK
+
+class RedBlackTree(BinarySearchTree):
+    """
+    Self-balancing binary search tree.
+    Every node is red or black, the root is black, a red node has no red
+    children, and every root-to-leaf path has the same number of black
+    nodes. Together these keep the height at most 2*log2(n + 1), so
+    insert, search and delete are O(log n) even for sorted input.
+    search, traversal and validation are inherited from BinarySearchTree.
+    """
+    @classmethod
+    def from_sorted(cls, values):
+        """
+        Build a red-black tree from a sequence of values.
+        Nodes need colors and parent links, so values are inserted one at
+        a time rather than laid out directly.
+        Time Complexity: O(n log n)
+        """
+        tree = cls()
+        for value in values:
+            tree.insert(value)
+        return tree
+    
+    def _rotate_left(self, node):
+        """
+        Rotate the subtree rooted at node to the left.
+        Time Complexity: O(1)
+        """
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        self._transplant(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+    
+    def _rotate_right(self, node):
+        """
+        Rotate the subtree rooted at node to the right.
+        Time Complexity: O(1)
+        """
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        self._transplant(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+    
+    def _transplant(self, old, new):
+        """
+        Replace the subtree rooted at old with the subtree rooted at new.
+        """
+        if old.parent is None:
+            self.root = new
+        elif old is old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        if new is not None:
+            new.parent = old.parent
+    
+    def insert(self, value):
+        """
+        Insert a value into the tree and restore the red-black properties.
+        Time Complexity: O(log n)
+        """
+        node = RBNode(value)
+        parent = None
+        current = self.root
+        while current is not None:
+            parent = current
+            current = current.left if value < current.value else current.right
+        
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif value < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+        
+        self._insert_fixup(node)
+    
+    def _insert_fixup(self, node):
+        """
+        Fix a red node with a red parent after insertion.
+        Time Complexity: O(log n) recolorings, at most two rotations
+        """
+        while node.parent is not None and node.parent.color == RED:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if not _is_black(uncle):
+                    # Red uncle: recolor and continue from the grandparent
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                else:
+                    # Black uncle: rotate the red pair up
+                    if node is parent.right:
+                        node = parent
+                        self._rotate_left(node)
+                        parent = node.parent
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if not _is_black(uncle):
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self._rotate_right(node)
+                        parent = node.parent
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._rotate_left(grandparent)
+        
+        self.root.color = BLACK
+    
+    def delete(self, value):
+        """
+        Delete a value from the tree and restore the red-black properties.
+        Time Complexity: O(log n)
+        """
+        node = self.search(value)
+        if node is None:
+            return
+        
+        removed_color = node.color
+        if node.left is None:
+            child, child_parent = node.right, node.parent
+            self._transplant(node, node.right)
+        elif node.right is None:
+            child, child_parent = node.left, node.parent
+            self._transplant(node, node.left)
+        else:
+            # Two children: move the inorder successor into node's place
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            removed_color = successor.color
+            child = successor.right
+            if successor.parent is node:
+                child_parent = successor
+            else:
+                child_parent = successor.parent
+                self._transplant(successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.color = node.color
+        
+        if removed_color == BLACK:
+            self._delete_fixup(child, child_parent)
+    
+    def _delete_fixup(self, node, parent):
+        """
+        Restore the black height after a black node was removed.
+        node carries an extra black and may be None, so its parent is
+        passed explicitly.
+        Time Complexity: O(log n) recolorings, at most three rotations
+        """
+        while node is not self.root and _is_black(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if _is_black(sibling.left) and _is_black(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                else:
+                    if _is_black(sibling.right):
+                        sibling.left.color = BLACK
+                        sibling.color = RED
+                        self._rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.right.color = BLACK
+                    self._rotate_left(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if _is_black(sibling.left) and _is_black(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                else:
+                    if _is_black(sibling.left):
+                        sibling.right.color = BLACK
+                        sibling.color = RED
+                        self._rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.left.color = BLACK
+                    self._rotate_right(parent)
+                    node = self.root
+        
+        if node is not None:
+            node.color = BLACK
 
 def main():
     # Create a new BST
@@ -196,6 +658,32 @@ def main():
     
     # Get height
     print(f"\nHeight of the BST: {bst.get_height()}")
+    
+    # Compare heights on sorted input
+    print("\nInserting 1..100 in sorted order:")
+    plain = BinarySearchTree()
+    balanced = RedBlackTree()
+    for value in range(1, 101):
+        plain.insert(value)
+        balanced.insert(value)
+    print(f"Plain BST height: {plain.get_height()}")
+    print(f"Red-black tree height: {balanced.get_height()}")
+    print(f"from_sorted BST height: {BinarySearchTree.from_sorted(range(1, 101)).get_height()}")
+    
+    # Array-backed BST
+    print("\nArray-backed BST inorder traversal after deleting 30:")
+    arr_bst = ArrayBinarySearchTree()
+    for value in values:
+        arr_bst.insert(value)
+    arr_bst.delete(30)
+    arr_bst.inorder_traversal()
+    print(f"\nNumber of nodes: {arr_bst.get_size()}")
+    
+    # Integer-only array-backed BST
+    int_bst = IntArrayBinarySearchTree()
+    for value in values:
+        int_bst.insert(value)
+    print(f"Integer BST contains 60: {int_bst.search(60) != -1}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
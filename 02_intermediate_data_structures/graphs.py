@@ -6,9 +6,80 @@ connecting these vertices. This implementation includes both adjacency list and
 matrix representations, along with common graph algorithms.
 """
 
+from array import array
 from collections import defaultdict, deque
+from collections.abc import Mapping
 import heapq
 
+def _dijkstra_csr(indptr, indices, weights, src, dist, prev):
+    """
+    Dijkstra's algorithm over CSR arrays using integer vertex ids.
+    Fills dist with shortest distances from src and prev with each
+    vertex's predecessor on its shortest path (-1 if none). dist must
+    start out as infinity everywhere.
+    Time Complexity: O((V + E)logV) where V is vertices and E is edges
+    """
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    dist[src] = 0
+    # Entries are (distance, id) pairs of plain numbers. Equal distances
+    # fall back to an int compare, and since finalize() numbers vertices
+    # in sorted order when it can, ties pop in the same order their
+    # labels would.
+    priority_queue = [(0, src)]
+    
+    while priority_queue:
+        current_distance, u = heappop(priority_queue)
+        
+        # Skip stale entries left behind by a later, shorter relaxation
+        if current_distance > dist[u]:
+            continue
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            distance = current_distance + weights[k]
+            
+            if distance < dist[v]:
+                dist[v] = distance
+                prev[v] = u
+                heappush(priority_queue, (distance, v))
+
+class _PathMap(Mapping):
+    """
+    Read-only mapping from each vertex to its shortest path.
+    Paths are rebuilt from the predecessor array on first access and
+    cached, so callers only pay for the destinations they look up.
+    Unreachable vertices map to an empty path.
+    """
+    def __init__(self, label_of, id_of, prev, src):
+        self._label_of = label_of
+        self._id_of = id_of
+        self._prev = prev
+        self._src = src
+        self._cache = {}
+    
+    def __getitem__(self, vertex):
+        path = self._cache.get(vertex)
+        if path is None:
+            i = self._id_of[vertex]
+            prev = self._prev
+            label_of = self._label_of
+            path = []
+            if i == self._src or prev[i] != -1:
+                # Walk the predecessors back to the source
+                while i != -1:
+                    path.append(label_of[i])
+                    i = prev[i]
+                path.reverse()
+            self._cache[vertex] = path
+        return path
+    
+    def __iter__(self):
+        return iter(self._label_of)
+    
+    def __len__(self):
+        return len(self._label_of)
+
 class Graph:
     def __init__(self, directed=False):
         """
@@ -17,9 +88,20 @@ class Graph:
             directed (bool): If True, the graph is directed
         """
         self.directed = directed
+        # The only per-vertex copy of the edges; flat arrays for hot loops
+        # are packed from it rather than kept in sync on every add_edge
         self.adj_list = defaultdict(list)  # Adjacency list representation
         self.vertices = set()
         self.edges = []
+        self.version = 0  # Bumped on every change, for caches held elsewhere
+        # Compressed sparse row (CSR) adjacency, built by finalize() and
+        # dropped whenever the graph changes
+        self.indptr = None
+        self.indices = None
+        self.edge_weights = None
+        self.id_of = None  # Vertex -> dense id used by the CSR arrays
+        self.label_of = None  # Dense id -> vertex, the inverse of id_of
+        self._matrix_cache = None  # (matrix, vertices) until the graph changes
     
     def add_vertex(self, vertex):
         """
@@ -27,6 +109,9 @@ class Graph:
         Time Complexity: O(1)
         """
         self.vertices.add(vertex)
+        self.version += 1
+        self.indptr = None
+        self._matrix_cache = None
     
     def add_edge(self, from_vertex, to_vertex, weight=1):
         """
@@ -35,12 +120,48 @@ class Graph:
         """
         self.vertices.add(from_vertex)
         self.vertices.add(to_vertex)
+        self.version += 1
+        self.indptr = None
+        self._matrix_cache = None
         self.adj_list[from_vertex].append((to_vertex, weight))
         self.edges.append((from_vertex, to_vertex, weight))
         
         if not self.directed:
             self.adj_list[to_vertex].append((from_vertex, weight))
     
+    def finalize(self):
+        """
+        Build the CSR adjacency used by the traversal algorithms.
+        Vertices get dense integer ids in sorted order, or in set order if
+        the vertices cannot be compared with each other; id_of maps a vertex
+        to its id and label_of maps an id back to the vertex. The neighbors
+        of vertex id u are indices[indptr[u]:indptr[u + 1]], with matching
+        entries in edge_weights. Called automatically by bfs, dfs and
+        dijkstra when the graph has changed since the last build.
+        Time Complexity: O(V log V + E)
+        """
+        try:
+            labels = sorted(self.vertices)
+        except TypeError:
+            labels = list(self.vertices)
+        id_of = {vertex: i for i, vertex in enumerate(labels)}
+        indptr = array('i', [0])
+        indices = array('i')
+        # Weights stay a list so integer weights give integer distances
+        edge_weights = []
+        
+        for vertex in labels:
+            for neighbor, weight in self.adj_list.get(vertex, ()):
+                indices.append(id_of[neighbor])
+                edge_weights.append(weight)
+            indptr.append(len(indices))
+        
+        self.id_of = id_of
+        self.label_of = labels
+        self.indices = indices
+        self.edge_weights = edge_weights
+        self.indptr = indptr
+    
     def get_vertices(self):
         """
         Get all vertices in the graph.
@@ -58,15 +179,22 @@ class Graph:
     def get_adjacency_matrix(self):
         """
         Get the adjacency matrix representation of the graph.
-        Time Complexity: O(V^2) where V is the number of vertices
+        The result is cached until the graph changes. Rows and vertices
+        are returned as tuples, so callers cannot modify the cached copy.
+        Time Complexity: O(V^2) where V is the number of vertices, O(1) when cached
         """
-        vertices = sorted(list(self.vertices))
+        if self._matrix_cache is not None:
+            return self._matrix_cache
+        if self.indptr is None:
+            self.finalize()
+        
+        # Reuse the sorted vertices and index mapping built by finalize().
+        # The labels are copied: bfs, dfs and dijkstra still read the list.
+        vertices = tuple(self.label_of)
+        vertex_to_index = self.id_of
         n = len(vertices)
         matrix = [[0] * n for _ in range(n)]
         
-        # Create vertex to index mapping
-        vertex_to_index = {vertex: i for i, vertex in enumerate(vertices)}
-        
         # Fill the matrix
         for from_vertex, to_vertex, weight in self.edges:
             i = vertex_to_index[from_vertex]
@@ -75,7 +203,8 @@ class Graph:
             if not self.directed:
                 matrix[j][i] = weight
         
-        return matrix, vertices
+        self._matrix_cache = tuple(map(tuple, matrix)), vertices
+        return self._matrix_cache
     
     def bfs(self, start_vertex):
         """
@@ -86,78 +215,95 @@ class Graph:
         """
         if start_vertex not in self.vertices:
             return []
+        if self.indptr is None:
+            self.finalize()
         
-        visited = set()
-        queue = deque([start_vertex])
-        visited.add(start_vertex)
+        indptr = self.indptr
+        indices = self.indices
+        start = self.id_of[start_vertex]
+        # A fresh buffer per call is a single C-level allocation and keeps
+        # concurrent or interrupted searches from sharing marks
+        visited = bytearray(len(self.label_of))
+        queue = deque()
+        enqueue = queue.append
+        dequeue = queue.popleft
         bfs_order = []
+        visit = bfs_order.append
+        enqueue(start)
+        visited[start] = 1
         
         while queue:
-            vertex = queue.popleft()
-            bfs_order.append(vertex)
+            vertex = dequeue()
+            visit(vertex)
             
-            for neighbor, _ in self.adj_list[vertex]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
+            for neighbor in indices[indptr[vertex]:indptr[vertex + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    enqueue(neighbor)
         
-        return bfs_order
+        label_of = self.label_of
+        return [label_of[vertex] for vertex in bfs_order]
     
     def dfs(self, start_vertex):
         """
         Perform Depth-First Search starting from a vertex.
+        Uses an explicit stack, so long paths cannot exceed the recursion limit.
         Time Complexity: O(V + E) where V is vertices and E is edges
         Returns:
             List of vertices in DFS order
         """
         if start_vertex not in self.vertices:
             return []
+        if self.indptr is None:
+            self.finalize()
         
-        visited = set()
+        indptr = self.indptr
+        indices = self.indices
+        visited = bytearray(len(self.label_of))
         dfs_order = []
+        visit = dfs_order.append
+        stack = [self.id_of[start_vertex]]
+        push = stack.append
+        pop = stack.pop
         
-        def dfs_recursive(vertex):
-            visited.add(vertex)
-            dfs_order.append(vertex)
+        while stack:
+            vertex = pop()
+            if visited[vertex]:
+                continue
+            visited[vertex] = 1
+            visit(vertex)
             
-            for neighbor, _ in self.adj_list[vertex]:
-                if neighbor not in visited:
-                    dfs_recursive(neighbor)
+            # Push in reverse so neighbors are visited in insertion order,
+            # matching the recursive traversal
+            for neighbor in reversed(indices[indptr[vertex]:indptr[vertex + 1]]):
+                if not visited[neighbor]:
+                    push(neighbor)
         
-        dfs_recursive(start_vertex)
-        return dfs_order
+        label_of = self.label_of
+        return [label_of[vertex] for vertex in dfs_order]
     
     def dijkstra(self, start_vertex):
         """
         Find shortest paths from start_vertex to all other vertices using Dijkstra's algorithm.
         Time Complexity: O((V + E)logV) where V is vertices and E is edges
         Returns:
-            Dictionary of shortest distances and paths
+            Dictionary of shortest distances and a mapping of shortest
+            paths, where each path is only built when it is looked up
         """
         if start_vertex not in self.vertices:
             return {}
+        if self.indptr is None:
+            self.finalize()
         
-        distances = {vertex: float('infinity') for vertex in self.vertices}
-        distances[start_vertex] = 0
-        paths = {vertex: [] for vertex in self.vertices}
-        paths[start_vertex] = [start_vertex]
-        
-        priority_queue = [(0, start_vertex)]
-        
-        while priority_queue:
-            current_distance, current_vertex = heapq.heappop(priority_queue)
-            
-            if current_distance > distances[current_vertex]:
-                continue
-            
-            for neighbor, weight in self.adj_list[current_vertex]:
-                distance = current_distance + weight
-                
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    paths[neighbor] = paths[current_vertex] + [neighbor]
-                    heapq.heappush(priority_queue, (distance, neighbor))
+        label_of = self.label_of
+        n = len(label_of)
+        dist = [float('infinity')] * n
+        prev = array('i', [-1]) * n
+        src = self.id_of[start_vertex]
+        _dijkstra_csr(self.indptr, self.indices, self.edge_weights, src, dist, prev)
         
+        distances = dict(zip(label_of, dist))
+        paths = _PathMap(label_of, self.id_of, prev, src)
         return distances, paths
 
 def main():
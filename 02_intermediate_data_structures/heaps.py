@@ -5,8 +5,12 @@ A heap is a specialized tree-based data structure that satisfies the heap proper
 - In a Max Heap: Parent nodes are greater than or equal to their children
 - In a Min Heap: Parent nodes are less than or equal to their children
 Heaps are commonly used to implement priority queues and for heap sort.
+Min heaps delegate to the standard library's heapq module, which runs the
+same algorithm in C; max heaps use the sift loops below.
 """
 
+import heapq
+
 class Heap:
     def __init__(self, heap_type="min"):
         """
@@ -18,78 +22,57 @@ class Heap:
         self.heap_type = heap_type
         self.size = 0
     
-    def _parent(self, i):
-        """
-        Get the index of the parent of node at index i.
-        """
-        return (i - 1) // 2
-    
-    def _left_child(self, i):
-        """
-        Get the index of the left child of node at index i.
-        """
-        return 2 * i + 1
-    
-    def _right_child(self, i):
-        """
-        Get the index of the right child of node at index i.
-        """
-        return 2 * i + 2
-    
-    def _swap(self, i, j):
-        """
-        Swap elements at indices i and j.
-        """
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
-    
     def _heapify_up(self, i):
         """
-        Maintain heap property by bubbling up the element at index i.
+        Maintain max heap property by bubbling up the element at index i.
+        Parents are moved down into the hole until the element's slot is
+        found, in a loop rather than by recursion.
         Time Complexity: O(log n)
         """
-        parent = self._parent(i)
+        heap = self.heap
+        item = heap[i]
         
-        if self.heap_type == "min":
-            if i > 0 and self.heap[i] < self.heap[parent]:
-                self._swap(i, parent)
-                self._heapify_up(parent)
-        else:  # max heap
-            if i > 0 and self.heap[i] > self.heap[parent]:
-                self._swap(i, parent)
-                self._heapify_up(parent)
+        while i > 0:
+            parent = (i - 1) // 2
+            if not item > heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        
+        heap[i] = item
     
     def _heapify_down(self, i):
         """
-        Maintain heap property by bubbling down the element at index i.
+        Maintain max heap property by bubbling down the element at index i.
         Time Complexity: O(log n)
         """
-        left = self._left_child(i)
-        right = self._right_child(i)
-        smallest_or_largest = i
+        heap = self.heap
+        size = self.size
         
-        if self.heap_type == "min":
-            if left < self.size and self.heap[left] < self.heap[smallest_or_largest]:
-                smallest_or_largest = left
-            if right < self.size and self.heap[right] < self.heap[smallest_or_largest]:
-                smallest_or_largest = right
-        else:  # max heap
-            if left < self.size and self.heap[left] > self.heap[smallest_or_largest]:
-                smallest_or_largest = left
-            if right < self.size and self.heap[right] > self.heap[smallest_or_largest]:
-                smallest_or_largest = right
-        
-        if smallest_or_largest != i:
-            self._swap(i, smallest_or_largest)
-            self._heapify_down(smallest_or_largest)
+        while True:
+            left = 2 * i + 1
+            right = left + 1
+            largest = i
+            if left < size and heap[left] > heap[largest]:
+                largest = left
+            if right < size and heap[right] > heap[largest]:
+                largest = right
+            if largest == i:
+                break
+            heap[i], heap[largest] = heap[largest], heap[i]
+            i = largest
     
     def insert(self, value):
         """
         Insert a value into the heap.
         Time Complexity: O(log n)
         """
-        self.heap.append(value)
         self.size += 1
-        self._heapify_up(self.size - 1)
+        if self.heap_type == "min":
+            heapq.heappush(self.heap, value)
+        else:
+            self.heap.append(value)
+            self._heapify_up(self.size - 1)
     
     def extract_top(self):
         """
@@ -99,12 +82,17 @@ class Heap:
         if self.size == 0:
             raise IndexError("Heap is empty")
         
+        if self.heap_type == "min":
+            self.size -= 1
+            return heapq.heappop(self.heap)
+        
         if self.size == 1:
             self.size -= 1
             return self.heap.pop()
         
-        root = self.heap[0]
-        self.heap[0] = self.heap.pop()
+        heap = self.heap
+        root = heap[0]
+        heap[0] = heap.pop()
         self.size -= 1
         self._heapify_down(0)
         
@@ -141,9 +129,14 @@ class Heap:
         self.heap = arr
         self.size = len(arr)
         
+        if self.heap_type == "min":
+            heapq.heapify(arr)
+            return
+        
         # Start from the last non-leaf node and heapify down
+        heapify_down = self._heapify_down
         for i in range(self.size // 2 - 1, -1, -1):
-            self._heapify_down(i)
+            heapify_down(i)
 
 def main():
     # Demonstrate Min Heap
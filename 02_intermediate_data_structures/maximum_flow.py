@@ -1,14 +1,21 @@
 """
 Maximum Flow Algorithms in Python
 ------------------------------
-This implementation includes the Ford-Fulkerson algorithm with Edmonds-Karp
-optimization for finding the maximum flow in a network. The algorithm uses
-BFS to find augmenting paths, ensuring polynomial time complexity.
+This implementation includes the Ford-Fulkerson method for finding the maximum
+flow in a network, using Dinic's algorithm: BFS builds a level graph, then DFS
+pushes a blocking flow along it before the levels are rebuilt. A plain BFS
+augmenting path search (Edmonds-Karp) is also available.
 """
 
+from array import array
 from collections import defaultdict, deque
 
 class MaxFlow:
+    # The residual capacities are a dense V x V matrix only for graphs with
+    # at most this many vertices that also link a quarter or more of all
+    # vertex pairs; everything else uses one dict per vertex
+    _DENSE_MAX_VERTICES = 2048
+    
     def __init__(self, graph):
         """
         Initialize with a graph.
@@ -18,21 +25,122 @@ class MaxFlow:
         self.graph = graph
         self.vertices = graph.get_vertices()
         self.adj_list = graph.adj_list
-        self.residual_graph = defaultdict(dict)
+        # Dense integer id of each vertex, used to index the residual rows
+        self._id_of = {vertex: i for i, vertex in enumerate(self.vertices)}
+        self.residual_graph = None
+        self._neighbors = None
         self.initialize_residual_graph()
+        # Search buffers reused by every augmenting path search, indexed by
+        # vertex id. A parent of -1 marks a vertex the search has not reached.
+        n = len(self.vertices)
+        self._parent = array('i', [-1]) * n
+        self._min_capacity = [0] * n
+        self._queue = deque()
+        # Dinic's level of each vertex id and next edge to try from it
+        self._level = None
+        self._next_edge = None
     
     def initialize_residual_graph(self):
         """
-        Initialize the residual graph with forward and backward edges.
+        Initialize the residual graph, indexed by vertex id.
+        residual_graph[i][j] is the residual capacity from vertex id i to
+        vertex id j, so backward edges start at 0. _neighbors[i] lists the
+        ids joined to i by an edge in either direction, letting searches
+        skip the pairs with no edge between them.
+        Each row is a dict holding only those pairs, which keeps memory at
+        O(V + E). Small dense graphs get a V x V list matrix instead, which
+        is faster to index.
+        Time Complexity: O(V + E), or O(V² + E) for the dense matrix
         """
-        # Add forward edges
+        n = len(self.vertices)
+        id_of = self._id_of
+        residual = [{} for _ in range(n)]
+        neighbors = [[] for _ in range(n)]
+        
         for vertex in self.vertices:
-            for neighbor, capacity in self.adj_list[vertex]:
-                self.residual_graph[vertex][neighbor] = capacity
-                # Initialize backward edge with 0 capacity
-                if neighbor not in self.residual_graph:
-                    self.residual_graph[neighbor] = {}
-                self.residual_graph[neighbor][vertex] = 0
+            u = id_of[vertex]
+            row = residual[u]
+            for neighbor, capacity in self.adj_list.get(vertex, ()):
+                v = id_of[neighbor]
+                if v not in row:
+                    row[v] = 0
+                    residual[v][u] = 0
+                    neighbors[u].append(v)
+                    neighbors[v].append(u)
+                # Parallel edges add up; a backward edge never hides a
+                # forward capacity
+                row[v] += capacity
+        
+        # Each linked pair shows up in two rows
+        pairs = sum(map(len, neighbors))
+        if n <= self._DENSE_MAX_VERTICES and 4 * pairs >= n * n:
+            dense = [[0] * n for _ in range(n)]
+            for u, row in enumerate(residual):
+                dense_row = dense[u]
+                for v, capacity in row.items():
+                    dense_row[v] = capacity
+            residual = dense
+        
+        self.residual_graph = residual
+        self._neighbors = neighbors
+    
+    def _augmenting_path(self, source, sink):
+        """
+        Find a shortest augmenting path between vertex ids using BFS.
+        Returns:
+            Tuple of (path of ids, min_capacity) or (None, 0) if no path exists
+        """
+        residual = self.residual_graph
+        neighbors = self._neighbors
+        parent = self._parent
+        min_capacity = self._min_capacity
+        queue = self._queue
+        queue.clear()
+        enqueue = queue.append
+        dequeue = queue.popleft
+        parent[source] = source
+        min_capacity[source] = float('inf')
+        reached = [source]
+        enqueue(source)
+        found = False
+        path = None
+        
+        try:
+            while queue and not found:
+                current = dequeue()
+                row = residual[current]
+                bottleneck = min_capacity[current]
+                
+                for neighbor in neighbors[current]:
+                    capacity = row[neighbor]
+                    if capacity > 0 and parent[neighbor] == -1:
+                        parent[neighbor] = current
+                        reached.append(neighbor)
+                        min_capacity[neighbor] = min(bottleneck, capacity)
+                        
+                        if neighbor == sink:
+                            found = True
+                            break
+                        
+                        enqueue(neighbor)
+            
+            if found:
+                # Reconstruct path
+                path = [sink]
+                current = sink
+                while current != source:
+                    current = parent[current]
+                    path.append(current)
+                path.reverse()
+        finally:
+            # Reset only the entries this search marked, even if it was
+            # interrupted, so the next search starts from a clean array
+            for vertex in reached:
+                parent[vertex] = -1
+        
+        if path is None:
+            return None, 0
+        return path, min_capacity[sink]
     
     def bfs_augmenting_path(self, source, sink):
         """
@@ -40,35 +148,91 @@ class MaxFlow:
         Returns:
             Tuple of (path, min_capacity) or (None, 0) if no path exists
         """
-        parent = {source: None}
-        min_capacity = {source: float('inf')}
-        queue = deque([source])
+        id_of = self._id_of
+        if source not in id_of or sink not in id_of:
+            return None, 0
+        
+        path, min_capacity = self._augmenting_path(id_of[source], id_of[sink])
+        if path is None:
+            return None, 0
+        return [self.vertices[i] for i in path], min_capacity
+    
+    def _bfs_levels(self, source, sink):
+        """
+        Label each vertex id with its BFS distance from source, following
+        only edges with residual capacity.
+        Time Complexity: O(V + E)
+        Returns:
+            True if sink is reachable, False otherwise
+        """
+        residual = self.residual_graph
+        neighbors = self._neighbors
+        level = [-1] * len(self.vertices)
+        queue = self._queue
+        enqueue = queue.append
+        dequeue = queue.popleft
+        queue.clear()
+        level[source] = 0
+        enqueue(source)
         
         while queue:
-            current = queue.popleft()
+            current = dequeue()
+            row = residual[current]
+            next_level = level[current] + 1
+            
+            for neighbor in neighbors[current]:
+                if level[neighbor] < 0 and row[neighbor] > 0:
+                    level[neighbor] = next_level
+                    enqueue(neighbor)
+        
+        self._level = level
+        return level[sink] >= 0
+    
+    def _dfs_push(self, source, sink):
+        """
+        Find an augmenting path in the current level graph, moving to a
+        vertex one level deeper at each step. Each vertex keeps a pointer
+        to the next edge to try, so edges that are saturated or lead to a
+        dead end are never scanned again in the same phase.
+        Returns:
+            Tuple of (path of ids, min_capacity) or (None, 0) if the flow
+            in this level graph is blocking
+        """
+        residual = self.residual_graph
+        neighbors = self._neighbors
+        level = self._level
+        next_edge = self._next_edge
+        path = [source]
+        
+        while path:
+            current = path[-1]
+            if current == sink:
+                min_capacity = min(residual[path[i]][path[i + 1]]
+                                   for i in range(len(path) - 1))
+                return path, min_capacity
+            
+            row = residual[current]
+            edges = neighbors[current]
+            next_level = level[current] + 1
+            i = next_edge[current]
+            while i < len(edges) and not (row[edges[i]] > 0 and level[edges[i]] == next_level):
+                i += 1
+            next_edge[current] = i
             
-            for neighbor, capacity in self.residual_graph[current].items():
-                if capacity > 0 and neighbor not in parent:
-                    parent[neighbor] = current
-                    min_capacity[neighbor] = min(min_capacity[current], capacity)
-                    
-                    if neighbor == sink:
-                        # Reconstruct path
-                        path = []
-                        current = sink
-                        while current is not None:
-                            path.append(current)
-                            current = parent[current]
-                        return path[::-1], min_capacity[sink]
-                    
-                    queue.append(neighbor)
+            if i < len(edges):
+                path.append(edges[i])
+            else:
+                # Dead end: retreat and skip the edge that led here
+                path.pop()
+                if path:
+                    next_edge[path[-1]] += 1
         
         return None, 0
     
     def ford_fulkerson(self, source, sink):
         """
-        Find maximum flow using Ford-Fulkerson algorithm with Edmonds-Karp optimization.
-        Time Complexity: O(VE²) where V is vertices and E is edges
+        Find maximum flow using the Ford-Fulkerson method with Dinic's algorithm.
+        Time Complexity: O(V²E) where V is vertices and E is edges
         Args:
             source: Source vertex
             sink: Sink vertex
@@ -77,29 +241,41 @@ class MaxFlow:
         """
         max_flow = 0
         flow_network = defaultdict(dict)
+        labels = self.vertices
         
         # Initialize flow network
-        for vertex in self.vertices:
-            for neighbor in self.residual_graph[vertex]:
-                flow_network[vertex][neighbor] = 0
+        for vertex in labels:
+            for neighbor in self._neighbors[self._id_of[vertex]]:
+                flow_network[vertex][labels[neighbor]] = 0
         
-        while True:
-            # Find augmenting path
-            path, min_capacity = self.bfs_augmenting_path(source, sink)
-            
-            if path is None:
-                break
-            
-            # Update residual graph and flow network
-            for i in range(len(path) - 1):
-                u, v = path[i], path[i + 1]
-                # Update residual capacities
-                self.residual_graph[u][v] -= min_capacity
-                self.residual_graph[v][u] += min_capacity
-                # Update flow network
-                flow_network[u][v] += min_capacity
+        if source == sink or source not in self._id_of or sink not in self._id_of:
+            return max_flow, flow_network
+        
+        residual = self.residual_graph
+        source = self._id_of[source]
+        sink = self._id_of[sink]
+        
+        # Each phase rebuilds the level graph and saturates it
+        while self._bfs_levels(source, sink):
+            self._next_edge = [0] * len(labels)
             
-            max_flow += min_capacity
+            while True:
+                # Find augmenting path
+                path, min_capacity = self._dfs_push(source, sink)
+                
+                if path is None:
+                    break
+                
+                # Update residual graph and flow network
+                for i in range(len(path) - 1):
+                    u, v = path[i], path[i + 1]
+                    # Update residual capacities
+                    residual[u][v] -= min_capacity
+                    residual[v][u] += min_capacity
+                    # Update flow network
+                    flow_network[labels[u]][labels[v]] += min_capacity
+                
+                max_flow += min_capacity
         
         return max_flow, flow_network
 
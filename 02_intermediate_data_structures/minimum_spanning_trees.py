@@ -6,6 +6,7 @@ the minimum spanning tree of a graph. A minimum spanning tree is a subset of
 edges that connects all vertices with the minimum possible total edge weight.
 """
 
+from array import array
 from collections import defaultdict
 import heapq
 
@@ -13,24 +14,37 @@ class DisjointSet:
     """
     Disjoint Set data structure for Kruskal's algorithm.
     Used to efficiently manage connected components.
+    Elements are the integers 0..size-1. A single signed array holds the
+    whole structure: parent[x] is x's parent if x is not a root, and
+    -(size of x's set) if it is.
     """
-    def __init__(self, vertices):
-        self.parent = {vertex: vertex for vertex in vertices}
-        self.rank = {vertex: 0 for vertex in vertices}
+    __slots__ = ('parent',)
+    
+    def __init__(self, size):
+        self.parent = array('i', [-1]) * size
     
     def find(self, vertex):
         """
         Find the root of the set containing vertex.
-        Uses path compression for efficiency.
+        Uses path compression for efficiency: a first loop walks up to the
+        root, a second points every vertex on the way directly at it.
         """
-        if self.parent[vertex] != vertex:
-            self.parent[vertex] = self.find(self.parent[vertex])
-        return self.parent[vertex]
+        parent = self.parent
+        root = vertex
+        while parent[root] >= 0:
+            root = parent[root]
+        
+        while vertex != root:
+            next_vertex = parent[vertex]
+            parent[vertex] = root
+            vertex = next_vertex
+        return root
     
     def union(self, vertex1, vertex2):
         """
         Union the sets containing vertex1 and vertex2.
-        Uses union by rank for efficiency.
+        Uses union by size for efficiency: the smaller set is attached
+        under the root of the larger one.
         """
         root1 = self.find(vertex1)
         root2 = self.find(vertex2)
@@ -38,13 +52,52 @@ class DisjointSet:
         if root1 == root2:
             return
         
-        if self.rank[root1] < self.rank[root2]:
-            self.parent[root1] = root2
-        elif self.rank[root1] > self.rank[root2]:
-            self.parent[root2] = root1
-        else:
-            self.parent[root2] = root1
-            self.rank[root1] += 1
+        parent = self.parent
+        # Sizes are stored negated, so the larger set has the smaller entry
+        if parent[root1] > parent[root2]:
+            root1, root2 = root2, root1
+        parent[root1] += parent[root2]
+        parent[root2] = root1
+
+def _kruskal_core(order, from_ids, to_ids, parent, tree_size):
+    """
+    The union-find loop of Kruskal's algorithm.
+    Edge i runs from from_ids[i] to to_ids[i], and order lists the edge
+    indices sorted by weight. parent is a DisjointSet's signed array,
+    updated in place. find (with path halving) and union by size are
+    inlined, so an edge costs no calls and no tuple unpacking.
+    Returns:
+        Indices of the edges that joined two components
+    """
+    chosen = []
+    for i in order:
+        root1 = from_ids[i]
+        root2 = to_ids[i]
+        while parent[root1] >= 0:
+            grandparent = parent[parent[root1]]
+            if grandparent >= 0:
+                parent[root1] = grandparent
+            root1 = parent[root1]
+        while parent[root2] >= 0:
+            grandparent = parent[parent[root2]]
+            if grandparent >= 0:
+                parent[root2] = grandparent
+            root2 = parent[root2]
+        
+        # Same component: this edge would create a cycle
+        if root1 == root2:
+            continue
+        
+        if parent[root1] > parent[root2]:
+            root1, root2 = root2, root1
+        parent[root1] += parent[root2]
+        parent[root2] = root1
+        
+        chosen.append(i)
+        if len(chosen) == tree_size:
+            break
+    
+    return chosen
 
 class MST:
     def __init__(self, graph):
@@ -54,8 +107,35 @@ class MST:
             graph: Graph object with vertices and edges
         """
         self.graph = graph
-        self.vertices = graph.get_vertices()
-        self.edges = graph.get_edges()
+        self._version = None
+        self._refresh()
+    
+    def _refresh(self):
+        """
+        Snapshot the graph's vertices and edges as tuples, unless the
+        graph has not changed since the last snapshot.
+        Vertex ids and the compressed sparse row (CSR) adjacency come from
+        Graph.finalize(): the neighbors of vertex id u are
+        indices[indptr[u]:indptr[u + 1]], with the matching edge weights
+        at the same positions in csr_weights.
+        Time Complexity: O(1) if unchanged, O(V log V + E) otherwise
+        """
+        graph = self.graph
+        if self._version == graph.version:
+            return
+        if graph.indptr is None:
+            graph.finalize()
+        self._version = graph.version
+        self.vertices = tuple(graph.label_of)
+        self.edges = tuple(graph.get_edges())
+        self._id_of = graph.id_of
+        self.indptr = graph.indptr
+        self.indices = graph.indices
+        self.csr_weights = graph.edge_weights
+        # Edge i as parallel arrays of endpoint ids and weights
+        self.from_ids = array('i', [self._id_of[u] for u, _, _ in self.edges])
+        self.to_ids = array('i', [self._id_of[v] for _, v, _ in self.edges])
+        self.edge_weight_list = [w for _, _, w in self.edges]
     
     def kruskal(self):
         """
@@ -64,61 +144,201 @@ class MST:
         Returns:
             List of edges in the MST and total weight
         """
-        # Sort edges by weight
-        sorted_edges = sorted(self.edges, key=lambda x: x[2])
+        self._refresh()
+        
+        # Sort edge indices by weight; the sort is stable, so equal
+        # weights keep their insertion order
+        weights = self.edge_weight_list
+        order = sorted(range(len(weights)), key=weights.__getitem__)
         
         # Initialize disjoint set
-        ds = DisjointSet(self.vertices)
+        ds = DisjointSet(len(self.vertices))
         
         mst_edges = []
         total_weight = 0
         
-        for from_vertex, to_vertex, weight in sorted_edges:
-            # Check if adding this edge creates a cycle
-            if ds.find(from_vertex) != ds.find(to_vertex):
-                mst_edges.append((from_vertex, to_vertex, weight))
-                total_weight += weight
-                ds.union(from_vertex, to_vertex)
+        # A spanning tree is complete once it has V - 1 edges
+        for i in _kruskal_core(order, self.from_ids, self.to_ids, ds.parent,
+                               len(self.vertices) - 1):
+            mst_edges.append(self.edges[i])
+            total_weight += weights[i]
+        
+        return mst_edges, total_weight
+    
+    def boruvka(self):
+        """
+        Find MST using Boruvka's algorithm.
+        Each round finds the cheapest edge leaving every component in one
+        pass over the edges, then merges along all of them. Components at
+        least halve each round, so there are at most log V rounds.
+        Time Complexity: O(E log V) where V is vertices and E is edges
+        Returns:
+            List of edges in the MST and total weight
+        """
+        self._refresh()
+        from_ids, to_ids = self.from_ids, self.to_ids
+        weights = self.edge_weight_list
+        n = len(self.vertices)
+        ds = DisjointSet(n)
+        find = ds.find
+        
+        mst_edges = []
+        total_weight = 0
+        
+        while True:
+            # Cheapest edge index leaving each component, keyed by its root.
+            # Ties go to the lower index so components agree on shared edges.
+            cheapest = [-1] * n
+            for i in range(len(weights)):
+                root1 = find(from_ids[i])
+                root2 = find(to_ids[i])
+                if root1 == root2:
+                    continue
+                weight = weights[i]
+                for root in (root1, root2):
+                    best = cheapest[root]
+                    if best == -1 or weight < weights[best]:
+                        cheapest[root] = i
+            
+            merged = False
+            for i in cheapest:
+                if i != -1 and find(from_ids[i]) != find(to_ids[i]):
+                    ds.union(from_ids[i], to_ids[i])
+                    mst_edges.append(self.edges[i])
+                    total_weight += weights[i]
+                    merged = True
+            
+            if not merged:
+                break
         
         return mst_edges, total_weight
     
     def prim(self, start_vertex=None):
         """
         Find MST using Prim's algorithm.
+        An edge is only queued if it is lighter than the best edge seen so
+        far into its endpoint, which keeps most stale entries out of the heap.
+        Runs on integer vertex ids over the CSR arrays and translates back
+        to vertex labels only for the edges that enter the tree.
         Time Complexity: O((V + E) log V) where V is vertices and E is edges
         Args:
             start_vertex: Optional starting vertex. If None, uses first vertex
         Returns:
             List of edges in the MST and total weight
         """
+        self._refresh()
         if not self.vertices:
             return [], 0
         
         if start_vertex is None:
-            start_vertex = self.vertices[0]
+            start_vertex = next(iter(self.graph.vertices))
+        if start_vertex not in self._id_of:
+            return [], 0
+        
+        indptr, indices, weights = self.indptr, self.indices, self.csr_weights
+        vertices = self.vertices
+        heappush, heappop = heapq.heappush, heapq.heappop
         
         # Initialize data structures
-        visited = set([start_vertex])
+        start = self._id_of[start_vertex]
+        visited = bytearray(len(vertices))
+        visited[start] = 1
+        in_tree = 1
         mst_edges = []
         total_weight = 0
+        # Lightest known edge weight into each vertex id
+        best = [float('inf')] * len(vertices)
+        best[start] = 0
         
-        # Priority queue for edges (weight, from_vertex, to_vertex)
+        # Priority queue for edges (weight, from_id, to_id), built in one
+        # O(k) heapify rather than k pushes
         edges = []
-        for neighbor, weight in self.graph.adj_list[start_vertex]:
-            heapq.heappush(edges, (weight, start_vertex, neighbor))
+        for k in range(indptr[start], indptr[start + 1]):
+            neighbor = indices[k]
+            weight = weights[k]
+            if weight < best[neighbor]:
+                best[neighbor] = weight
+                edges.append((weight, start, neighbor))
+        heapq.heapify(edges)
+        
+        while edges and in_tree < len(vertices):
+            weight, u, v = heappop(edges)
+            
+            # Skip edges into the tree or superseded by a lighter one
+            if visited[v] or weight > best[v]:
+                continue
+            
+            visited[v] = 1
+            in_tree += 1
+            mst_edges.append((vertices[u], vertices[v], weight))
+            total_weight += weight
+            
+            # Add new edges to priority queue
+            for k in range(indptr[v], indptr[v + 1]):
+                neighbor = indices[k]
+                weight = weights[k]
+                if not visited[neighbor] and weight < best[neighbor]:
+                    best[neighbor] = weight
+                    heappush(edges, (weight, v, neighbor))
+        
+        return mst_edges, total_weight
+    
+    def prim_dense(self, start_vertex=None):
+        """
+        Find MST using the adjacency matrix form of Prim's algorithm.
+        Each step scans every vertex for the cheapest one to add next, with
+        no heap, which is faster than prim() when E is close to V².
+        Time Complexity: O(V²) where V is the number of vertices
+        Args:
+            start_vertex: Optional starting vertex. If None, uses first vertex
+        Returns:
+            List of edges in the MST and total weight
+        """
+        self._refresh()
+        if not self.vertices:
+            return [], 0
+        
+        if start_vertex is None:
+            start_vertex = next(iter(self.graph.vertices))
+        if start_vertex not in self._id_of:
+            return [], 0
+        
+        # Lightest edge between each pair of vertex ids, inf if none
+        vertices = self.vertices
+        n = len(vertices)
+        id_of = self._id_of
+        inf = float('inf')
+        matrix = [[inf] * n for _ in range(n)]
+        for from_vertex, to_vertex, weight in self.edges:
+            i = id_of[from_vertex]
+            j = id_of[to_vertex]
+            if i != j and weight < matrix[i][j]:
+                matrix[i][j] = weight
+                matrix[j][i] = weight
+        
+        # dist[v] is the lightest edge from the tree to v, via parent[v]
+        dist = [inf] * n
+        parent = [-1] * n
+        dist[id_of[start_vertex]] = 0
+        remaining = list(range(n))
+        mst_edges = []
+        total_weight = 0
         
-        while edges and len(visited) < len(self.vertices):
-            weight, from_vertex, to_vertex = heapq.heappop(edges)
+        while remaining:
+            u = min(remaining, key=dist.__getitem__)
+            if dist[u] == inf:
+                break  # The rest is unreachable from start_vertex
+            remaining.remove(u)
             
-            if to_vertex not in visited:
-                visited.add(to_vertex)
-                mst_edges.append((from_vertex, to_vertex, weight))
-                total_weight += weight
-                
-                # Add new edges to priority queue
-                for neighbor, weight in self.graph.adj_list[to_vertex]:
-                    if neighbor not in visited:
-                        heapq.heappush(edges, (weight, to_vertex, neighbor))
+            if parent[u] != -1:
+                mst_edges.append((vertices[parent[u]], vertices[u], dist[u]))
+                total_weight += dist[u]
+            
+            row = matrix[u]
+            for v in remaining:
+                if row[v] < dist[v]:
+                    dist[v] = row[v]
+                    parent[v] = u
         
         return mst_edges, total_weight
 
@@ -166,11 +386,23 @@ def main():
         print(f"{from_vertex} -- {weight} -- {to_vertex}")
     print(f"Total Weight: {prim_weight}")
     
+    # Find MST using the dense variant of Prim's algorithm
+    print("\nPrim's Algorithm (adjacency matrix):")
+    print("-" * 30)
+    dense_edges, dense_weight = mst.prim_dense()
+    print("MST Edges:")
+    for from_vertex, to_vertex, weight in dense_edges:
+        print(f"{from_vertex} -- {weight} -- {to_vertex}")
+    print(f"Total Weight: {dense_weight}")
+    
     # Verify that both algorithms give the same total weight
     print("\nVerification:")
     print(f"Kruskal's total weight: {kruskal_weight}")
     print(f"Prim's total weight: {prim_weight}")
-    print(f"Algorithms agree: {kruskal_weight == prim_weight}")
+    print(f"Dense Prim's total weight: {dense_weight}")
+    boruvka_weight = mst.boruvka()[1]
+    print(f"Boruvka's total weight: {boruvka_weight}")
+    print(f"Algorithms agree: {kruskal_weight == prim_weight == dense_weight == boruvka_weight}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,7 +5,11 @@ A binary tree is a tree data structure in which each node has at most two childr
 referred to as the left child and the right child.
 """
 
+from collections import deque
+
 class TreeNode:
+    __slots__ = ('value', 'left', 'right')
+    
     def __init__(self, value):
         """
         Initialize a tree node with a value.
@@ -30,9 +34,9 @@ class BinaryTree:
             self.root = TreeNode(value)
             return
         
-        queue = [self.root]
+        queue = deque([self.root])
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             
             if not node.left:
                 node.left = TreeNode(value)
@@ -47,63 +51,102 @@ class BinaryTree:
     def inorder_traversal(self, node=None):
         """
         Perform inorder traversal (Left -> Root -> Right).
+        Uses an explicit stack of the nodes whose left subtree is in progress.
         Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
         """
         if node is None:
             node = self.root
         
-        if node:
-            self.inorder_traversal(node.left)
-            print(node.value, end=" ")
-            self.inorder_traversal(node.right)
+        order = []
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            order.append(node.value)
+            node = node.right
+        
+        return order
     
     def preorder_traversal(self, node=None):
         """
         Perform preorder traversal (Root -> Left -> Right).
         Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
         """
         if node is None:
             node = self.root
         
-        if node:
-            print(node.value, end=" ")
-            self.preorder_traversal(node.left)
-            self.preorder_traversal(node.right)
+        order = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node:
+                order.append(node.value)
+                # Right is pushed first so the left subtree is visited first
+                stack.append(node.right)
+                stack.append(node.left)
+        
+        return order
     
     def postorder_traversal(self, node=None):
         """
         Perform postorder traversal (Left -> Right -> Root).
+        Each node is pushed twice: once to expand its children and once,
+        beneath them, to be visited after both subtrees.
         Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
         """
         if node is None:
             node = self.root
         
-        if node:
-            self.postorder_traversal(node.left)
-            self.postorder_traversal(node.right)
-            print(node.value, end=" ")
+        order = []
+        stack = [(node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not node:
+                continue
+            if expanded:
+                order.append(node.value)
+            else:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+        
+        return order
     
     def level_order_traversal(self):
         """
         Perform level order traversal (Breadth-First).
         Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
         """
         if not self.root:
-            return
+            return []
         
-        queue = [self.root]
+        order = []
+        queue = deque([self.root])
         while queue:
-            node = queue.pop(0)
-            print(node.value, end=" ")
+            node = queue.popleft()
+            order.append(node.value)
             
             if node.left:
                 queue.append(node.left)
             if node.right:
                 queue.append(node.right)
+        
+        return order
     
     def height(self, node=None):
         """
         Calculate the height of the tree.
+        Counts levels with a level-order traversal instead of recursing.
         Time Complexity: O(n)
         """
         if node is None:
@@ -112,10 +155,18 @@ class BinaryTree:
         if not node:
             return -1
         
-        left_height = self.height(node.left)
-        right_height = self.height(node.right)
+        height = -1
+        queue = deque([node])
+        while queue:
+            height += 1
+            for _ in range(len(queue)):
+                current = queue.popleft()
+                if current.left:
+                    queue.append(current.left)
+                if current.right:
+                    queue.append(current.right)
         
-        return max(left_height, right_height) + 1
+        return height
     
     def count_nodes(self, node=None):
         """
@@ -125,10 +176,16 @@ class BinaryTree:
         if node is None:
             node = self.root
         
-        if not node:
-            return 0
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node:
+                count += 1
+                stack.append(node.left)
+                stack.append(node.right)
         
-        return 1 + self.count_nodes(node.left) + self.count_nodes(node.right)
+        return count
     
     def is_leaf(self, node):
         """
@@ -145,13 +202,139 @@ class BinaryTree:
         if node is None:
             node = self.root
         
-        if not node:
-            return 0
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            if self.is_leaf(node):
+                count += 1
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        
+        return count
+
+class ArrayBinaryTree:
+    """
+    Binary tree stored in level order in a single list, as a heap is.
+    BinaryTree.insert always fills the tree level by level, so the tree
+    is complete and needs no child pointers: the children of index i
+    are at 2*i + 1 and 2*i + 2, and there is no Python object per node.
+    """
+    def __init__(self):
+        """
+        Initialize an empty binary tree.
+        """
+        self.values = []
+    
+    def insert(self, value):
+        """
+        Insert a value into the binary tree.
+        Time Complexity: O(1) amortized
+        """
+        self.values.append(value)
+    
+    def inorder_traversal(self):
+        """
+        Perform inorder traversal (Left -> Root -> Right).
+        Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
+        """
+        values = self.values
+        n = len(values)
+        order = []
+        stack = []
+        i = 0
+        while stack or i < n:
+            while i < n:
+                stack.append(i)
+                i = 2 * i + 1
+            i = stack.pop()
+            order.append(values[i])
+            i = 2 * i + 2
+        
+        return order
+    
+    def preorder_traversal(self):
+        """
+        Perform preorder traversal (Root -> Left -> Right).
+        Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
+        """
+        values = self.values
+        n = len(values)
+        order = []
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if i < n:
+                order.append(values[i])
+                stack.append(2 * i + 2)
+                stack.append(2 * i + 1)
         
-        if self.is_leaf(node):
-            return 1
+        return order
+    
+    def postorder_traversal(self):
+        """
+        Perform postorder traversal (Left -> Right -> Root).
+        Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
+        """
+        values = self.values
+        n = len(values)
+        order = []
+        stack = [(0, False)]
+        while stack:
+            i, expanded = stack.pop()
+            if i >= n:
+                continue
+            if expanded:
+                order.append(values[i])
+            else:
+                stack.append((i, True))
+                stack.append((2 * i + 2, False))
+                stack.append((2 * i + 1, False))
         
-        return self.count_leaves(node.left) + self.count_leaves(node.right)
+        return order
+    
+    def level_order_traversal(self):
+        """
+        Perform level order traversal (Breadth-First).
+        Level order is simply the storage order.
+        Time Complexity: O(n)
+        Returns:
+            List of values in visiting order
+        """
+        return list(self.values)
+    
+    def height(self):
+        """
+        Calculate the height of the tree.
+        A complete tree with n nodes has height floor(log2(n)).
+        Time Complexity: O(1)
+        """
+        return len(self.values).bit_length() - 1
+    
+    def count_nodes(self):
+        """
+        Count the total number of nodes in the tree.
+        Time Complexity: O(1)
+        """
+        return len(self.values)
+    
+    def count_leaves(self):
+        """
+        Count the number of leaf nodes in the tree.
+        In a complete tree every index from n // 2 onwards is a leaf.
+        Time Complexity: O(1)
+        """
+        n = len(self.values)
+        return n - n // 2
 
 def main():
     # Create a new binary tree
@@ -170,19 +353,29 @@ def main():
     # Perform different traversals
     print("\nTree Traversals:")
     print("Inorder traversal (Left -> Root -> Right):")
-    tree.inorder_traversal()
-    print("\n\nPreorder traversal (Root -> Left -> Right):")
-    tree.preorder_traversal()
-    print("\n\nPostorder traversal (Left -> Right -> Root):")
-    tree.postorder_traversal()
-    print("\n\nLevel order traversal (Breadth-First):")
-    tree.level_order_traversal()
+    print(*tree.inorder_traversal())
+    print("\nPreorder traversal (Root -> Left -> Right):")
+    print(*tree.preorder_traversal())
+    print("\nPostorder traversal (Left -> Right -> Root):")
+    print(*tree.postorder_traversal())
+    print("\nLevel order traversal (Breadth-First):")
+    print(*tree.level_order_traversal())
     
     # Tree properties
-    print("\n\nTree Properties:")
+    print("\nTree Properties:")
     print(f"Height of the tree: {tree.height()}")
     print(f"Total number of nodes: {tree.count_nodes()}")
     print(f"Number of leaf nodes: {tree.count_leaves()}")
+    
+    # Same tree stored as a level-order array
+    print("\nArray-backed tree:")
+    array_tree = ArrayBinaryTree()
+    for value in values:
+        array_tree.insert(value)
+    print("Inorder traversal:")
+    print(*array_tree.inorder_traversal())
+    print(f"Height: {array_tree.height()}, nodes: {array_tree.count_nodes()}, "
+          f"leaves: {array_tree.count_leaves()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -34,7 +34,13 @@ class stack:
         return len(self.container)
     
     def output(self):
-        return self.container[stack]
+        return list(self.container)
+
+    def __iter__(self):
+        return iter(self.container)
+
+    def __repr__(self):
+        return f"stack({list(self.container)})"
 
 s = stack()
 
@@ -1,14 +1,62 @@
 import smtplib
+import threading
 from email.message import EmailMessage
 
-def send_email(to, subject, body):
+# Connection shared by send_email calls, opened on first use
+_smtp = None
+_smtp_lock = threading.Lock()
+
+def _connect():
+    smtp = smtplib.SMTP('smtp.gmail.com', 587)
+    try:
+        smtp.starttls()
+        smtp.login('your_email@example.com', 'your_password')
+    except BaseException:
+        # Don't leak the socket if the handshake or login fails
+        smtp.close()
+        raise
+    return smtp
+
+def _build_message(to, subject, body):
     msg = EmailMessage()
     msg['Subject'] = subject
     msg['From'] = 'your_email@example.com'
     msg['To'] = to
     msg.set_content(body)
+    return msg
 
-    with smtplib.SMTP('smtp.gmail.com', 587) as smtp:
-        smtp.starttls()
-        smtp.login('your_email@example.com', 'your_password')
-        smtp.send_message(msg)
\ No newline at end of file
+def send_email(to, subject, body):
+    global _smtp
+    msg = _build_message(to, subject, body)
+
+    with _smtp_lock:
+        if _smtp is None:
+            _smtp = _connect()
+        try:
+            _smtp.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+            # The server dropped the idle connection, or timed it out with a
+            # 421 reply (which smtplib raises as e.g. SMTPSenderRefused);
+            # reconnect once
+            if isinstance(e, smtplib.SMTPResponseException) and e.smtp_code != 421:
+                raise
+            _smtp.close()
+            _smtp = None  # Stays unset if reconnecting fails
+            _smtp = _connect()
+            _smtp.send_message(msg)
+
+def send_emails(messages):
+    # One TLS handshake and login for the whole batch of EmailMessages
+    with _connect() as smtp:
+        for msg in messages:
+            smtp.send_message(msg)
+
+def close_smtp():
+    global _smtp
+    with _smtp_lock:
+        if _smtp is not None:
+            try:
+                _smtp.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
+            _smtp = None
\ No newline at end of file
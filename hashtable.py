@@ -1,18 +1,36 @@
 class Hash:
     def __init__(self) -> None:
         self.MAX = 10
-        self.arr = [None for i in range (self.MAX)]
+        self.arr = [[] for i in range (self.MAX)]
+        self.count = 0
 
     def get_hash(self,key):
-        hash = 0
-        for char in key:
-            hash += ord(char) 
-        return hash % self.MAX
+        return hash(key) % self.MAX
     
     def __getitem__(self,index):
         h = self.get_hash(index)
-        return self.arr[h]
+        for k, v in self.arr[h]:
+            if k == index:
+                return v
+        return None
     
     def __setitem__(self,key,val):
         h = self.get_hash(key)
-        self.arr[h] =val
\ No newline at end of file
+        bucket = self.arr[h]
+        for i, (k, v) in enumerate(bucket):
+            if k == key:
+                bucket[i] = (key, val)
+                return
+        bucket.append((key, val))
+        self.count += 1
+        # Keep chains short by doubling the buckets past a 0.7 load factor
+        if self.count / self.MAX > 0.7:
+            self.rehash()
+
+    def rehash(self):
+        old = self.arr
+        self.MAX *= 2
+        self.arr = [[] for i in range (self.MAX)]
+        for bucket in old:
+            for k, v in bucket:
+                self.arr[self.get_hash(k)].append((k, v))
\ No newline at end of file